@@ -1,6 +1,11 @@
 # SPDX-License-Identifier: Apache-2.0
 """
 Entrypoint — run with: python -m app
+
+Runs uvicorn on uvloop + httptools with WEB_CONCURRENCY worker processes
+(default 1). Workers share nothing in memory — each keeps its own DB pools,
+JWT cache and user-store cache — so scale out with replicas first and raise
+WEB_CONCURRENCY only with the database connection budget in mind.
 """
 
 import uvicorn
@@ -12,5 +17,8 @@ if __name__ == "__main__":
         host=settings.app_host,
         port=settings.app_port,
         log_level=settings.log_level.lower(),
+        loop="uvloop",
+        http="httptools",
+        workers=max(1, settings.web_concurrency),
         reload=False,
     )
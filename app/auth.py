@@ -7,9 +7,13 @@ API-key security middleware + JWT session auth.
 
 from __future__ import annotations
 
-import secrets
+import hashlib
+import hmac
 import logging
+import threading
+import time
 
+from cachetools import TLRUCache
 from fastapi import HTTPException, Security, Depends, status, Request
 from fastapi.security import APIKeyHeader
 
@@ -20,6 +24,45 @@ logger = logging.getLogger("lipana.auth")
 
 _api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# Decoded JWT payloads keyed by token digest, so repeat dashboard requests
+# skip signature verification. Entries live 60 s or until the token's own
+# exp, whichever comes first. Failed verifications are never cached.
+_JWT_CACHE_TTL = 60
+_jwt_cache: TLRUCache = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _key, payload, now: min(now + _JWT_CACHE_TTL, payload.get("exp", 0)),
+    timer=time.time,
+)
+_jwt_cache_lock = threading.Lock()
+
+
+def _verify_cached(token: str) -> dict | None:
+    """verify_token() with a short-lived cache of successful results."""
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+    if payload is not None:
+        return payload
+    payload = verify_token(token)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        with _jwt_cache_lock:
+            _jwt_cache[key] = payload
+    return payload
+
+
+def _is_valid_api_key(api_key: str) -> bool:
+    """Check a key against the configured set by comparing SHA-256 digests.
+
+    Every configured digest is compared in constant time, without stopping
+    at the first match, so neither the key's content nor which entry it
+    matches shows up in response timing.
+    """
+    digest = hashlib.sha256(api_key.encode("utf-8")).digest()
+    valid = False
+    for known in settings.api_key_digests:
+        valid |= hmac.compare_digest(digest, known)
+    return valid
+
 
 async def require_api_key(
     api_key: str | None = Security(_api_key_header),
@@ -32,13 +75,7 @@ async def require_api_key(
             detail="Missing API key — provide X-API-Key header",
         )
 
-    # Constant-time comparison to prevent timing attacks
-    valid = any(
-        secrets.compare_digest(api_key, expected)
-        for expected in settings.api_key_list
-    )
-
-    if not valid:
+    if not _is_valid_api_key(api_key):
         logger.warning("Invalid API key attempted: %s…", api_key[:8])
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -57,7 +94,7 @@ async def require_session(request: Request) -> dict:
             detail="Missing or invalid session token",
         )
     token = auth_header[7:]
-    payload = verify_token(token)
+    payload = _verify_cached(token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -80,23 +117,12 @@ async def require_session_with_api_key(request: Request) -> str:
     """
     Dependency for API routes called from the dashboard.
     Validates JWT session, then uses the admin-stored API key for TMS calls.
-    Also accepts direct API key for backwards compatibility.
+    Falls back to a direct API key for backwards compatibility.
     """
-    # First try direct API key
-    api_key = request.headers.get("X-API-Key")
-    if api_key:
-        valid = any(
-            secrets.compare_digest(api_key, expected)
-            for expected in settings.api_key_list
-        )
-        if valid:
-            return api_key
-
-    # Then try JWT session
-    auth_header = request.headers.get("Authorization", "")
-    if auth_header.startswith("Bearer "):
-        token = auth_header[7:]
-        payload = verify_token(token)
+    # JWT session first — the dashboard's hot path
+    auth_header = request.headers.get("Authorization")
+    if auth_header and auth_header.startswith("Bearer "):
+        payload = _verify_cached(auth_header[7:])
         if payload:
             # Use admin-stored API key
             stored_key = get_api_key_from_admin()
@@ -106,6 +132,11 @@ async def require_session_with_api_key(request: Request) -> str:
             if settings.api_key_list:
                 return settings.api_key_list[0]
 
+    # Then direct API key
+    api_key = request.headers.get("X-API-Key")
+    if api_key and _is_valid_api_key(api_key):
+        return api_key
+
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Authentication required",
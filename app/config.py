@@ -5,6 +5,9 @@ Lipana TPS — Application configuration via environment variables.
 
 from __future__ import annotations
 
+import hashlib
+from functools import cached_property
+
 from pydantic_settings import BaseSettings
 
 
@@ -13,13 +16,19 @@ class Settings(BaseSettings):
     app_host: str = "0.0.0.0"
     app_port: int = 8100
     log_level: str = "info"
+    web_concurrency: int = 1  # uvicorn worker processes (each has its own DB pools)
 
     # API Security — comma-separated keys
     api_keys: str = "change-me-generate-a-real-key"
 
+    # Browser origins allowed by CORS, and Host headers accepted — comma-separated
+    cors_origins: str = "https://tazama.lipana.co,http://localhost:8100"
+    allowed_hosts: str = "tazama.lipana.co,localhost,127.0.0.1"
+
     # Tazama TMS
     tms_base_url: str = "http://gateway.tazama.svc.cluster.local:3000"
     tms_timeout: int = 30
+    tms_pool_size: int = 100  # keep-alive connections held open to TMS
 
     # Evaluation DB
     eval_db_host: str = "postgres.tazama.svc.cluster.local"
@@ -42,6 +51,11 @@ class Settings(BaseSettings):
     event_db_user: str = "postgres"
     event_db_password: str = "postgres"
 
+    # Per-statement timeout for pooled DB sessions (milliseconds)
+    db_statement_timeout_ms: int = 2000
+    # Longest wait for a pooled connection before a query fails (seconds)
+    db_pool_timeout: float = 3.0
+
     # Default tenant
     default_tenant_id: str = "DEFAULT"
 
@@ -49,13 +63,28 @@ class Settings(BaseSettings):
     k8s_namespace: str = "tazama"
     k8s_in_cluster: bool = True
     k8s_kubeconfig: str = ""  # path to kubeconfig if not in-cluster
+    k8s_pool_size: int = 32  # keep-alive connections to the API server
+    k8s_app_label_selector: str = ""  # default pod label selector, e.g. app.kubernetes.io/part-of=tazama
 
-    # Derived helpers
-    @property
+    # Derived helpers — computed once per Settings instance
+    @cached_property
     def api_key_list(self) -> list[str]:
         return [k.strip() for k in self.api_keys.split(",") if k.strip()]
 
-    @property
+    @cached_property
+    def cors_origin_list(self) -> list[str]:
+        return [o.strip() for o in self.cors_origins.split(",") if o.strip()]
+
+    @cached_property
+    def allowed_host_list(self) -> list[str]:
+        return [h.strip() for h in self.allowed_hosts.split(",") if h.strip()]
+
+    @cached_property
+    def api_key_digests(self) -> frozenset[bytes]:
+        """SHA-256 digests of the valid API keys, compared in constant time by auth."""
+        return frozenset(hashlib.sha256(k.encode("utf-8")).digest() for k in self.api_key_list)
+
+    @cached_property
     def eval_dsn(self) -> str:
         return (
             f"host={self.eval_db_host} port={self.eval_db_port} "
@@ -63,7 +92,7 @@ class Settings(BaseSettings):
             f"password={self.eval_db_password}"
         )
 
-    @property
+    @cached_property
     def config_dsn(self) -> str:
         return (
             f"host={self.config_db_host} port={self.config_db_port} "
@@ -71,7 +100,7 @@ class Settings(BaseSettings):
             f"password={self.config_db_password}"
         )
 
-    @property
+    @cached_property
     def event_dsn(self) -> str:
         return (
             f"host={self.event_db_host} port={self.event_db_port} "
@@ -1,255 +1,639 @@
 # SPDX-License-Identifier: Apache-2.0
 """
-Database helpers — thin wrappers around psycopg2 for the three Tazama
-PostgreSQL databases (evaluation, configuration, event_history).
+Database helpers — thin async wrappers around psycopg 3 for the three
+Tazama PostgreSQL databases (evaluation, configuration, event_history).
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from contextlib import contextmanager
-from typing import Any, Generator
-
-import psycopg2
-import psycopg2.extras
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator
+
+import orjson
+from cachetools import TTLCache
+from psycopg import AsyncConnection
+from psycopg.errors import QueryCanceled
+from psycopg.rows import dict_row, scalar_row
+from psycopg.types.json import set_json_loads
+from psycopg_pool import AsyncConnectionPool
 
 from app.config import settings
 
 logger = logging.getLogger("lipana.db")
 
+# Decode json/jsonb columns with orjson rather than the stdlib parser
+set_json_loads(orjson.loads)
+
+
+# One pool per DSN — avoids a fresh TCP + auth handshake on every query.
+# prepare_threshold=1 lets the server keep a plan for repeated lookups.
+# Every pooled session gets a statement_timeout so a runaway query cannot
+# pin a connection, and TCP keepalives so dead peers are noticed quickly.
+# Checkouts give up after db_pool_timeout rather than psycopg_pool's 30 s
+# default, so an unreachable database fails requests promptly.
+_POOL_MIN_SIZE = 2
+_POOL_MAX_SIZE = 20
+_pools: dict[str, AsyncConnectionPool] = {}
+
+
+def _connect_kwargs() -> dict[str, Any]:
+    return {
+        "prepare_threshold": 1,
+        "row_factory": dict_row,
+        "options": f"-c statement_timeout={settings.db_statement_timeout_ms}",
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 5,
+        "keepalives_count": 3,
+    }
+
+
+def _get_pool(dsn: str) -> AsyncConnectionPool:
+    pool = _pools.get(dsn)
+    if pool is None:
+        pool = AsyncConnectionPool(
+            conninfo=dsn,
+            min_size=_POOL_MIN_SIZE,
+            max_size=_POOL_MAX_SIZE,
+            kwargs=_connect_kwargs(),
+            timeout=settings.db_pool_timeout,
+            open=False,
+        )
+        _pools[dsn] = pool
+    return pool
 
-@contextmanager
-def _get_conn(dsn: str) -> Generator:
-    conn = psycopg2.connect(dsn)
-    try:
+
+async def open_pools() -> None:
+    """Open the evaluation and event-history pools (app startup)."""
+    for dsn in (settings.eval_dsn, settings.event_dsn):
+        await _get_pool(dsn).open()
+
+
+async def close_pools() -> None:
+    """Close every pool opened by this module (app shutdown)."""
+    for pool in _pools.values():
+        await pool.close()
+    _pools.clear()
+
+
+@asynccontextmanager
+async def _get_conn(dsn: str) -> AsyncIterator[AsyncConnection]:
+    pool = _get_pool(dsn)
+    if pool.closed:
+        await pool.open()
+    async with pool.connection() as conn:
         yield conn
-    finally:
-        conn.close()
+
+
+async def ping(dsn: str, timeout: float = 3.0) -> str:
+    """Run ``SELECT 1`` on a pooled connection; "ok" or the error text."""
+    pool = _get_pool(dsn)
+    try:
+        if pool.closed:
+            await pool.open()
+        async with pool.connection(timeout=timeout) as conn:
+            await conn.execute("SELECT 1;")
+        return "ok"
+    except Exception as exc:
+        return f"error: {exc}"
 
 
 # ------------------------------------------------------------------ #
-#  Evaluation DB queries
+#  Table discovery
 # ------------------------------------------------------------------ #
 
-def _discover_eval_table(conn) -> str | None:
-    """Discover the actual evaluation table name in the database.
-    Returns None if no user tables exist yet."""
-    with conn.cursor() as cur:
-        cur.execute("""
+# Known Tazama table names per database, tried in order, plus the name to
+# fall back to when several unrelated tables exist.
+_EVAL_TABLE_CANDIDATES = ("evaluationresult", "evaluationresults", "evaluation", "evaluations", "results")
+_EVENT_TABLE_CANDIDATES = ("transactionhistory", "transaction_history", "transaction", "transactions")
+
+# (dsn, candidates) -> (table name or None, monotonic time of discovery).
+# Found tables are cached for the process lifetime; "no tables yet" is
+# re-checked after a few seconds so the first pipeline write is picked up.
+_TABLE_RETRY_SECONDS = 5.0
+_table_cache: dict[tuple[str, tuple[str, ...]], tuple[str | None, float]] = {}
+
+
+async def _discover_table(
+    conn, dsn: str, candidates: tuple[str, ...], default: str,
+) -> str | None:
+    """Return the table to query in *dsn*, or None if it has no tables yet."""
+    key = (dsn, candidates)
+    cached = _table_cache.get(key)
+    if cached is not None:
+        name, discovered_at = cached
+        if name is not None or time.monotonic() - discovered_at < _TABLE_RETRY_SECONDS:
+            return name
+
+    async with conn.cursor(row_factory=scalar_row) as cur:
+        await cur.execute("""
             SELECT table_name FROM information_schema.tables
             WHERE table_schema = 'public'
               AND table_type = 'BASE TABLE'
             ORDER BY table_name;
         """)
-        tables = [r[0] for r in cur.fetchall()]
-        logger.info("Evaluation DB tables: %s", tables)
-        if not tables:
-            logger.info("No tables in evaluation DB — pipeline has not processed anything yet")
-            return None
-        # Try common Tazama table names
-        for candidate in ["evaluationresult", "evaluationresults", "evaluation", "evaluations", "results"]:
-            if candidate in tables:
-                return candidate
-        # Return first table if only one exists
-        if len(tables) == 1:
-            return tables[0]
-        # Fallback
-        return "evaluation"
-
-
-# Cache the discovered table name — re-discover if previously found nothing
-_eval_table_name: str | None = None
-_eval_table_found = False  # True only when a real table was found
-
-
-def _get_eval_table(conn) -> str | None:
-    global _eval_table_name, _eval_table_found
-    if _eval_table_found:
-        return _eval_table_name
-    # (Re-)discover — either first call, or last attempt found nothing
-    _eval_table_name = _discover_eval_table(conn)
-    if _eval_table_name is not None:
-        _eval_table_found = True
-    logger.info("Using evaluation table: %s", _eval_table_name)
-    return _eval_table_name
-
-
-def _discover_columns(conn, tbl: str) -> list[str]:
+        tables = await cur.fetchall()
+
+    if not tables:
+        logger.info("No tables in %s yet — pipeline has not processed anything", conn.info.dbname)
+        name = None
+    else:
+        name = next((c for c in candidates if c in tables), None)
+        if name is None:
+            # Use the only table if there is just one, else the default
+            name = tables[0] if len(tables) == 1 else default
+        logger.info("Tables in %s: %s — using %s", conn.info.dbname, tables, name)
+
+    _table_cache[key] = (name, time.monotonic())
+    return name
+
+
+# Above this many rows (planner estimate) dashboard counters are
+# extrapolated from a 1 % TABLESAMPLE instead of an exact COUNT(*).
+# A tenant with fewer sampled rows than _MIN_SAMPLED_TENANT_ROWS is
+# counted exactly instead: a small tenant often lands no rows in the
+# sample at all, and its exact count is cheap anyway.
+_EXACT_COUNT_LIMIT = 100_000
+_MIN_SAMPLED_TENANT_ROWS = 100
+
+
+async def _estimated_rows(conn, tbl: str) -> int:
+    """Planner row estimate for *tbl* from pg_class (-1 if never analyzed)."""
+    async with conn.cursor(row_factory=scalar_row) as cur:
+        await cur.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s);",
+            (tbl,),
+        )
+        n = await cur.fetchone()
+    return n if n is not None else -1
+
+
+# ------------------------------------------------------------------ #
+#  SQL text
+# ------------------------------------------------------------------ #
+
+# Statements are rendered once per (table, variant) and reused verbatim.
+# Identical text on every call means no per-request string building, and
+# lets prepare_threshold=1 keep one server-side plan per variant.
+
+@lru_cache(maxsize=None)
+def _evaluation_by_msg_id_sql(tbl: str, with_diagnostics: bool) -> str:
+    if with_diagnostics:
+        return f"""
+            WITH found AS (
+                SELECT evaluation
+                  FROM {tbl}
+                 WHERE "messageid" = %s
+                   AND "tenantid" = %s
+                 LIMIT 1
+            )
+            SELECT evaluation, NULL::boolean AS tenant_has_rows FROM found
+            UNION ALL
+            SELECT NULL, EXISTS (SELECT 1 FROM {tbl} WHERE "tenantid" = %s)
+             WHERE NOT EXISTS (SELECT 1 FROM found);
+        """
+    return f"""
+        SELECT evaluation
+          FROM {tbl}
+         WHERE "messageid" = %s
+           AND "tenantid" = %s
+         LIMIT 1;
+    """
+
+
+@lru_cache(maxsize=None)
+def _evaluations_sql(tbl: str, with_status: bool, with_after: bool, with_totals: bool) -> str:
+    conditions = ['"tenantid" = %s']
+    if with_status:
+        conditions.append("evaluation->'report'->>'status' = %s")
+    if with_after:
+        conditions.append('"messageid" < %s')
+
+    where = " AND ".join(conditions)
+    totals = """,
+            COUNT(*) OVER ()                                                        AS total_count,
+            COUNT(*) FILTER (WHERE evaluation->'report'->>'status' = 'ALRT') OVER () AS alert_count,
+            COUNT(*) FILTER (WHERE evaluation->'report'->>'status' = 'NALT') OVER () AS no_alert_count""" if with_totals else ""
+    return f"""
+        SELECT
+            "messageid"                                    AS msg_id,
+            evaluation->>'transactionID'                   AS transaction_id,
+            evaluation->'report'->>'status'                AS status,
+            evaluation->'report'->>'evaluationID'          AS evaluation_id,
+            evaluation->'report'->>'timestamp'             AS evaluated_at,
+            evaluation->'report'->'tadpResult'->>'prcgTm'  AS processing_time_ns,
+            (evaluation->'report'->'tadpResult'->'typologyResult')::text AS typology_results_json{totals}
+        FROM {tbl}
+        WHERE {where}
+        ORDER BY "messageid" DESC
+        LIMIT %s OFFSET %s;
+    """
+
+
+@lru_cache(maxsize=None)
+def _evaluation_counts_sql(tbl: str, sampled: bool) -> str:
+    if sampled:
+        return f"""
+            SELECT
+                COUNT(*)                                   AS sampled,
+                COUNT(*) FILTER (WHERE "tenantid" = %s)    AS total,
+                COUNT(*) FILTER (WHERE "tenantid" = %s
+                    AND evaluation->'report'->>'status' = 'ALRT') AS alerts,
+                COUNT(*) FILTER (WHERE "tenantid" = %s
+                    AND evaluation->'report'->>'status' = 'NALT') AS no_alerts
+            FROM {tbl} TABLESAMPLE SYSTEM (1);
+        """
+    return f"""
+        SELECT
+            COUNT(*)                                                        AS total,
+            COUNT(*) FILTER (WHERE evaluation->'report'->>'status' = 'ALRT') AS alerts,
+            COUNT(*) FILTER (WHERE evaluation->'report'->>'status' = 'NALT') AS no_alerts
+        FROM {tbl}
+        WHERE "tenantid" = %s;
+    """
+
+
+@lru_cache(maxsize=None)
+def _transaction_count_sql(tbl: str, sampled: bool) -> str:
+    if sampled:
+        return f"""
+            SELECT COUNT(*) AS sampled,
+                   COUNT(*) FILTER (WHERE tenantid = %s) AS cnt
+              FROM {tbl} TABLESAMPLE SYSTEM (1);
+        """
+    return f"""
+        SELECT COUNT(*)::int AS cnt
+          FROM {tbl}
+         WHERE tenantid = %s;
+    """
+
+
+# ------------------------------------------------------------------ #
+#  Evaluation DB queries
+# ------------------------------------------------------------------ #
+
+async def _get_eval_table(conn) -> str | None:
+    return await _discover_table(conn, settings.eval_dsn, _EVAL_TABLE_CANDIDATES, "evaluation")
+
+
+async def _discover_columns(conn, tbl: str) -> list[str]:
     """Return the list of column names for a table."""
-    with conn.cursor() as cur:
-        cur.execute(
+    async with conn.cursor(row_factory=scalar_row) as cur:
+        await cur.execute(
             "SELECT column_name FROM information_schema.columns "
             "WHERE table_schema = 'public' AND table_name = %s "
             "ORDER BY ordinal_position;",
             (tbl,),
         )
-        return [r[0] for r in cur.fetchall()]
+        return await cur.fetchall()
 
 
 _columns_logged = False
 
+# (msg_id, tenant_id) -> evaluation JSON. The pipeline writes an evaluation
+# once and never updates it, and this service never writes them, so a
+# found result can be served from memory for repeat views; misses are
+# not cached so polling callers see the row as soon as it lands. Entries
+# are kept serialized so each caller decodes its own copy of the tree.
+_EVALUATION_CACHE_TTL_SECONDS = 30
+_evaluation_cache: TTLCache = TTLCache(maxsize=2048, ttl=_EVALUATION_CACHE_TTL_SECONDS)
+
 
-def get_evaluation_by_msg_id(msg_id: str, tenant_id: str) -> dict | None:
+async def get_evaluation_by_msg_id(msg_id: str, tenant_id: str) -> dict | None:
     """Return the full evaluation JSONB for a given MsgId + tenant."""
     global _columns_logged
+    key = (msg_id, tenant_id)
+    cached = _evaluation_cache.get(key)
+    if cached is not None:
+        return orjson.loads(cached)
     try:
-        with _get_conn(settings.eval_dsn) as conn:
-            tbl = _get_eval_table(conn)
+        async with _get_conn(settings.eval_dsn) as conn:
+            tbl = await _get_eval_table(conn)
             if tbl is None:
                 logger.info("get_evaluation_by_msg_id: no evaluation table found yet")
                 return None
 
             # Log columns once to help diagnose schema issues
             if not _columns_logged:
-                cols = _discover_columns(conn, tbl)
+                cols = await _discover_columns(conn, tbl)
                 logger.info("Evaluation table '%s' columns: %s", tbl, cols)
                 # Log a sample row to see actual stored values
-                with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as scur:
-                    scur.execute(f'SELECT "messageid", "tenantid" FROM {tbl} LIMIT 3;')
-                    samples = scur.fetchall()
+                async with conn.cursor() as scur:
+                    await scur.execute(f'SELECT "messageid", "tenantid" FROM {tbl} LIMIT 3;')
+                    samples = await scur.fetchall()
                     for s in samples:
                         logger.info("  Sample row: messageid=%s tenantid=%s", s["messageid"], s["tenantid"])
                     if not samples:
                         logger.info("  Evaluation table is empty")
                 _columns_logged = True
 
-            sql = f"""
-                SELECT evaluation
-                  FROM {tbl}
-                 WHERE "messageid" = %s
-                   AND "tenantid" = %s
-                 LIMIT 1;
-            """
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-                cur.execute(sql, (msg_id, tenant_id))
-                row = cur.fetchone()
-                if row:
-                    logger.info("Found evaluation for MsgId=%s", msg_id)
-                    return dict(row["evaluation"])
-                else:
-                    # Check if any rows exist at all for this tenant
-                    cur.execute(f'SELECT COUNT(*) AS cnt FROM {tbl} WHERE "tenantid" = %s', (tenant_id,))
-                    cnt = cur.fetchone()["cnt"]
-                    logger.info(
-                        "No evaluation for MsgId=%s tenant=%s (table has %d rows for this tenant)",
-                        msg_id, tenant_id, cnt,
-                    )
-                    return None
+            # With DEBUG logging on, a miss also reports whether the tenant
+            # has any rows at all — folded into the same round trip, and
+            # only evaluated when the lookup itself finds nothing.
+            with_diagnostics = logger.isEnabledFor(logging.DEBUG)
+            params: tuple[str, ...] = (msg_id, tenant_id, tenant_id) if with_diagnostics else (msg_id, tenant_id)
+            async with conn.cursor() as cur:
+                await cur.execute(_evaluation_by_msg_id_sql(tbl, with_diagnostics), params)
+                row = await cur.fetchone()
+            if row and row["evaluation"] is not None:
+                logger.info("Found evaluation for MsgId=%s", msg_id)
+                evaluation = row["evaluation"]
+                _evaluation_cache[key] = orjson.dumps(evaluation)
+                return evaluation
+            if with_diagnostics:
+                logger.debug(
+                    "No evaluation for MsgId=%s tenant=%s (tenant_has_rows=%s)",
+                    msg_id, tenant_id, row["tenant_has_rows"],
+                )
+            return None
+    except QueryCanceled:
+        logger.warning("get_evaluation_by_msg_id exceeded the %d ms statement timeout", settings.db_statement_timeout_ms)
+        return None
     except Exception as exc:
         logger.warning("get_evaluation_by_msg_id failed: %s", exc)
         return None
 
 
-def list_evaluations(
+_EMPTY_COUNTS = {"total": 0, "alerts": 0, "no_alerts": 0}
+
+
+def _evaluations_query(
+    tbl: str,
+    tenant_id: str,
+    limit: int,
+    offset: int,
+    status_filter: str | None,
+    after_id: str | None = None,
+    with_totals: bool = False,
+) -> tuple[str, list[Any]]:
+    """Pick the SQL variant and bind parameters for one page of evaluation rows."""
+    params: list[Any] = [tenant_id]
+    with_status = status_filter in ("ALRT", "NALT")
+    if with_status:
+        params.append(status_filter)
+    if after_id is not None:
+        params.append(after_id)
+    params.extend([limit, offset])
+    return _evaluations_sql(tbl, with_status, after_id is not None, with_totals), params
+
+
+async def _select_evaluations(
+    conn,
+    tbl: str,
+    tenant_id: str,
+    limit: int,
+    offset: int,
+    status_filter: str | None,
+    after_id: str | None = None,
+    with_totals: bool = False,
+) -> list[dict[str, Any]]:
+    """Fetch one page of evaluation rows, newest message ID first.
+
+    *after_id* seeks past a previous page's last ``msg_id`` instead of
+    skipping *offset* rows. With *with_totals*, each row also carries
+    ``total_count``, ``alert_count`` and ``no_alert_count`` for the whole
+    filtered set, computed by window aggregates in the same scan.
+    """
+    sql, params = _evaluations_query(
+        tbl, tenant_id, limit, offset, status_filter, after_id, with_totals,
+    )
+    async with conn.cursor() as cur:
+        await cur.execute(sql, params)
+        return await cur.fetchall()
+
+
+def _counts_query(tbl: str, tenant_id: str, sampled: bool) -> tuple[str, tuple[str, ...]]:
+    """Tenant counts SQL and parameters — over a 1 % block sample if *sampled*."""
+    params = (tenant_id, tenant_id, tenant_id) if sampled else (tenant_id,)
+    return _evaluation_counts_sql(tbl, sampled), params
+
+
+def _scale_sample(row: dict | None, estimate: int) -> dict | None:
+    """Extrapolate sampled counts to the table estimate.
+
+    None when the sample holds too few of the tenant's rows to scale up.
+    """
+    if not row or row["total"] < _MIN_SAMPLED_TENANT_ROWS:
+        return None
+    scale = estimate / row["sampled"]
+    return {k: round(row[k] * scale) for k in ("total", "alerts", "no_alerts")}
+
+
+async def _count_evaluations(conn, tbl: str, tenant_id: str, estimate: int) -> dict:
+    """Total/alert/no-alert counts for a tenant; sampled when *estimate* is large."""
+    if estimate >= _EXACT_COUNT_LIMIT:
+        sql, params = _counts_query(tbl, tenant_id, sampled=True)
+        async with conn.cursor() as cur:
+            await cur.execute(sql, params)
+            counts = _scale_sample(await cur.fetchone(), estimate)
+        if counts is not None:
+            return counts
+        # Too few sampled tenant rows — fall through to the exact count
+
+    sql, params = _counts_query(tbl, tenant_id, sampled=False)
+    async with conn.cursor() as cur:
+        await cur.execute(sql, params)
+        row = await cur.fetchone()
+    return row if row else dict(_EMPTY_COUNTS)
+
+
+def _narrow_counts(counts: dict, status_filter: str | None) -> dict:
+    """Restrict tenant-wide counts to a single status, if one is filtered on."""
+    if status_filter == "ALRT":
+        return {"total": counts["alerts"], "alerts": counts["alerts"], "no_alerts": 0}
+    if status_filter == "NALT":
+        return {"total": counts["no_alerts"], "alerts": 0, "no_alerts": counts["no_alerts"]}
+    return counts
+
+
+async def list_evaluations(
     tenant_id: str,
     limit: int = 50,
     offset: int = 0,
     status_filter: str | None = None,
+    after_id: str | None = None,
 ) -> list[dict[str, Any]]:
-    """Return a paginated list of evaluations for a tenant."""
+    """Return a paginated list of evaluations for a tenant.
+
+    Pass the last ``msg_id`` of the previous page as *after_id* to seek
+    rather than skip; *offset* is then ignored.
+
+    ``typology_results_json`` is the raw JSON text of the typology results,
+    meant to be spliced into the response without a parse/re-encode cycle.
+    """
     try:
-        with _get_conn(settings.eval_dsn) as conn:
-            tbl = _get_eval_table(conn)
+        async with _get_conn(settings.eval_dsn) as conn:
+            tbl = await _get_eval_table(conn)
             if tbl is None:
                 return []
-            conditions = ['"tenantid" = %s']
-            params: list[Any] = [tenant_id]
-
-            if status_filter and status_filter in ("ALRT", "NALT"):
-                conditions.append("evaluation->'report'->>'status' = %s")
-                params.append(status_filter)
-
-            where = " AND ".join(conditions)
-            sql = f"""
-                SELECT
-                    "messageid"                                    AS msg_id,
-                    evaluation->>'transactionID'                   AS transaction_id,
-                    evaluation->'report'->>'status'                AS status,
-                    evaluation->'report'->>'evaluationID'          AS evaluation_id,
-                    evaluation->'report'->>'timestamp'             AS evaluated_at,
-                    evaluation->'report'->'tadpResult'->>'prcgTm'  AS processing_time_ns,
-                    evaluation->'report'->'tadpResult'->'typologyResult' AS typology_results
-                FROM {tbl}
-                WHERE {where}
-                ORDER BY "messageid" DESC
-                LIMIT %s OFFSET %s;
-            """
-            params.extend([limit, offset])
-
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-                cur.execute(sql, params)
-                rows = cur.fetchall()
-                return [dict(r) for r in rows]
+            if after_id is not None:
+                offset = 0
+            return await _select_evaluations(conn, tbl, tenant_id, limit, offset, status_filter, after_id)
+    except QueryCanceled:
+        logger.warning("list_evaluations exceeded the %d ms statement timeout", settings.db_statement_timeout_ms)
+        return []
     except Exception as exc:
         logger.warning("list_evaluations failed: %s", exc)
         return []
 
 
-def count_evaluations(tenant_id: str, status_filter: str | None = None) -> dict:
-    """Return total, alert, and no-alert counts."""
+async def count_evaluations(tenant_id: str, status_filter: str | None = None) -> dict:
+    """Return total, alert, and no-alert counts (estimated on large tables)."""
     try:
-        with _get_conn(settings.eval_dsn) as conn:
-            tbl = _get_eval_table(conn)
+        async with _get_conn(settings.eval_dsn) as conn:
+            tbl = await _get_eval_table(conn)
             if tbl is None:
-                return {"total": 0, "alerts": 0, "no_alerts": 0}
-            sql = f"""
-                SELECT
-                    COUNT(*)                                                        AS total,
-                    COUNT(*) FILTER (WHERE evaluation->'report'->>'status' = 'ALRT') AS alerts,
-                    COUNT(*) FILTER (WHERE evaluation->'report'->>'status' = 'NALT') AS no_alerts
-                FROM {tbl}
-                WHERE "tenantid" = %s;
-            """
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-                cur.execute(sql, (tenant_id,))
-                row = cur.fetchone()
-                return dict(row) if row else {"total": 0, "alerts": 0, "no_alerts": 0}
+                return dict(_EMPTY_COUNTS)
+            return await _count_evaluations(conn, tbl, tenant_id, await _estimated_rows(conn, tbl))
+    except QueryCanceled:
+        logger.warning("count_evaluations exceeded the %d ms statement timeout", settings.db_statement_timeout_ms)
+        return dict(_EMPTY_COUNTS)
     except Exception as exc:
         logger.warning("count_evaluations failed: %s", exc)
-        return {"total": 0, "alerts": 0, "no_alerts": 0}
+        return dict(_EMPTY_COUNTS)
+
+
+async def list_and_count_evaluations(
+    tenant_id: str,
+    limit: int = 50,
+    offset: int = 0,
+    status_filter: str | None = None,
+    after_id: str | None = None,
+) -> tuple[list[dict[str, Any]], dict]:
+    """Return one page of evaluations plus the counts for the same filter.
+
+    On tables below _EXACT_COUNT_LIMIT the page and its totals come from a
+    single windowed query. Larger tables fetch the page and sampled counts
+    separately, since the window would otherwise scan every tenant row.
+    A seek page (*after_id*) also counts separately: its window would only
+    see the rows past the cursor.
+    """
+    try:
+        async with _get_conn(settings.eval_dsn) as conn:
+            tbl = await _get_eval_table(conn)
+            if tbl is None:
+                return [], dict(_EMPTY_COUNTS)
+
+            if after_id is not None:
+                offset = 0
+
+            estimate = await _estimated_rows(conn, tbl)
+            if after_id is not None or estimate >= _EXACT_COUNT_LIMIT:
+                rows = await _select_evaluations(
+                    conn, tbl, tenant_id, limit, offset, status_filter, after_id,
+                )
+                counts = await _count_evaluations(conn, tbl, tenant_id, estimate)
+                return rows, _narrow_counts(counts, status_filter)
+
+            rows = await _select_evaluations(
+                conn, tbl, tenant_id, limit, offset, status_filter, with_totals=True,
+            )
+            if not rows:
+                # Past the last page the window has nothing to report on
+                if offset == 0:
+                    return [], dict(_EMPTY_COUNTS)
+                counts = await _count_evaluations(conn, tbl, tenant_id, estimate)
+                return [], _narrow_counts(counts, status_filter)
+
+            first = rows[0]
+            counts = {
+                "total": first["total_count"],
+                "alerts": first["alert_count"],
+                "no_alerts": first["no_alert_count"],
+            }
+            for row in rows:
+                del row["total_count"], row["alert_count"], row["no_alert_count"]
+            return rows, counts
+    except QueryCanceled:
+        logger.warning("list_and_count_evaluations exceeded the %d ms statement timeout", settings.db_statement_timeout_ms)
+        return [], dict(_EMPTY_COUNTS)
+    except Exception as exc:
+        logger.warning("list_and_count_evaluations failed: %s", exc)
+        return [], dict(_EMPTY_COUNTS)
+
+
+async def _evaluation_overview(tenant_id: str, recent_limit: int) -> tuple[dict, list[dict[str, Any]]]:
+    """Tenant counts plus the newest evaluations, pipelined on one connection."""
+    try:
+        async with _get_conn(settings.eval_dsn) as conn:
+            tbl = await _get_eval_table(conn)
+            if tbl is None:
+                return dict(_EMPTY_COUNTS), []
+
+            estimate = await _estimated_rows(conn, tbl)
+            sampled = estimate >= _EXACT_COUNT_LIMIT
+            counts_sql, counts_params = _counts_query(tbl, tenant_id, sampled)
+            page_sql, page_params = _evaluations_query(tbl, tenant_id, recent_limit, 0, None)
+
+            # Both statements go out in one write; replies are read back-to-back
+            async with conn.pipeline():
+                counts_cur = await conn.execute(counts_sql, counts_params)
+                page_cur = await conn.execute(page_sql, page_params)
+            row = await counts_cur.fetchone()
+            rows = await page_cur.fetchall()
+
+            if sampled:
+                counts = _scale_sample(row, estimate)
+                if counts is None:
+                    counts = await _count_evaluations(conn, tbl, tenant_id, -1)
+            else:
+                counts = row or dict(_EMPTY_COUNTS)
+            return counts, rows
+    except QueryCanceled:
+        logger.warning("_evaluation_overview exceeded the %d ms statement timeout", settings.db_statement_timeout_ms)
+        return dict(_EMPTY_COUNTS), []
+    except Exception as exc:
+        logger.warning("_evaluation_overview failed: %s", exc)
+        return dict(_EMPTY_COUNTS), []
+
+
+async def get_dashboard_bundle(tenant_id: str, recent_limit: int = 8) -> dict[str, Any]:
+    """Everything the overview page needs in one call.
+
+    The evaluation counts and recent rows share a pipelined round trip; the
+    event-history count lives in another database and runs concurrently.
+    """
+    (counts, recent), tx_count = await asyncio.gather(
+        _evaluation_overview(tenant_id, recent_limit),
+        count_transactions(tenant_id),
+    )
+    return {"counts": counts, "recent": recent, "transactions": tx_count}
 
 
 # ------------------------------------------------------------------ #
 #  Event History DB queries
 # ------------------------------------------------------------------ #
 
-def count_transactions(tenant_id: str) -> int:
-    """Count total transactions in event history for a tenant."""
+async def count_transactions(tenant_id: str) -> int:
+    """Count total transactions in event history for a tenant (estimated on large tables)."""
     try:
-        with _get_conn(settings.event_dsn) as conn:
-            # Discover actual table name
-            with conn.cursor() as tcur:
-                tcur.execute("""
-                    SELECT table_name FROM information_schema.tables
-                    WHERE table_schema = 'public' AND table_type = 'BASE TABLE'
-                    ORDER BY table_name;
-                """)
-                tables = [r[0] for r in tcur.fetchall()]
-                logger.info("Event history DB tables: %s", tables)
-
-            if not tables:
-                logger.info("No tables in event_history DB — no transactions yet")
+        async with _get_conn(settings.event_dsn) as conn:
+            tbl = await _discover_table(
+                conn, settings.event_dsn, _EVENT_TABLE_CANDIDATES, "transaction",
+            )
+            if tbl is None:
                 return 0
 
-            tbl = "transaction"  # default
-            for candidate in ["transactionhistory", "transaction_history", "transaction", "transactions"]:
-                if candidate in tables:
-                    tbl = candidate
-                    break
-            else:
-                if len(tables) == 1:
-                    tbl = tables[0]
-
-            sql = f"""
-                SELECT COUNT(*)::int AS cnt
-                  FROM {tbl}
-                 WHERE tenantid = %s;
-            """
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-                cur.execute(sql, (tenant_id,))
-                row = cur.fetchone()
+            estimate = await _estimated_rows(conn, tbl)
+            if estimate >= _EXACT_COUNT_LIMIT:
+                async with conn.cursor() as cur:
+                    await cur.execute(_transaction_count_sql(tbl, True), (tenant_id,))
+                    row = await cur.fetchone()
+                if row and row["cnt"] >= _MIN_SAMPLED_TENANT_ROWS:
+                    return round(row["cnt"] * estimate / row["sampled"])
+
+            async with conn.cursor() as cur:
+                await cur.execute(_transaction_count_sql(tbl, False), (tenant_id,))
+                row = await cur.fetchone()
                 return row["cnt"] if row else 0
+    except QueryCanceled:
+        logger.warning("count_transactions exceeded the %d ms statement timeout", settings.db_statement_timeout_ms)
+        return 0
     except Exception as exc:
         logger.warning("count_transactions failed: %s", exc)
         return 0
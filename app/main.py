@@ -6,19 +6,29 @@ Accessible at: https://tazama.lipana.co
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any, AsyncIterator
 
-from fastapi import FastAPI
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import settings
+from app.database import close_pools, open_pools, ping
 from app.models import HealthResponse
 from app.routes import dashboard, entry, exit as exit_routes, system
 from app.routes import users as users_routes
-from app.users import ensure_admin_exists
+from app.users import ensure_admin_exists, flush_users
 
 logging.basicConfig(
     level=getattr(logging, settings.log_level.upper(), logging.INFO),
@@ -28,6 +38,38 @@ logger = logging.getLogger("lipana")
 
 BASE_DIR = Path(__file__).parent
 
+# /health is polled by probes and the dashboard; reuse a recent result
+# rather than touching all three databases on every hit.
+_HEALTH_TTL_SECONDS = 5.0
+_health_cache: tuple[float, dict[str, str]] | None = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await open_pools()
+    # One keep-alive client for every TMS call, instead of a fresh
+    # connection pool (and TCP handshake) per forwarded message
+    app.state.tms_client = httpx.AsyncClient(
+        base_url=settings.tms_base_url,
+        timeout=settings.tms_timeout,
+        limits=httpx.Limits(
+            max_keepalive_connections=settings.tms_pool_size,
+            max_connections=settings.tms_pool_size * 2,
+        ),
+    )
+    # Open the first TMS connection now rather than on the first /evaluate;
+    # any response will do, and an unreachable TMS must not block startup
+    try:
+        await asyncio.wait_for(app.state.tms_client.get("/health"), 2.0)
+    except Exception as exc:
+        logger.info("TMS warm-up skipped: %s", exc)
+    await asyncio.to_thread(system.warm_k8s_clients)
+    yield
+    await app.state.tms_client.aclose()
+    system.close_k8s_clients()
+    flush_users()
+    await close_pools()
+
 
 def create_app() -> FastAPI:
     app = FastAPI(
@@ -41,55 +83,66 @@ def create_app() -> FastAPI:
         version="2.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     # CORS — allow dashboard access from configured origins
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[
-            "https://tazama.lipana.co",
-            "http://localhost:8100",
-            "*",
-        ],
+        allow_origins=settings.cors_origin_list,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
     # Trusted hosts
-    app.add_middleware(
-        TrustedHostMiddleware,
-        allowed_hosts=[
-            "tazama.lipana.co",
-            "localhost",
-            "127.0.0.1",
-            "*",
-        ],
-    )
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.allowed_host_list)
+
+    # Compress JSON/HTML bodies over 1 KiB (result pages, pod lists, logs)
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
     # Static files (CSS, JS, images)
     static_dir = BASE_DIR / "static"
     if static_dir.is_dir():
         app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
+    # Same body as FastAPI's stock handler, but serialized with orjson: the
+    # stock json.dumps raises on a NaN/Infinity input echoed in an error
+    @app.exception_handler(RequestValidationError)
+    async def validation_error(request: Request, exc: RequestValidationError) -> ORJSONResponse:
+        return ORJSONResponse(status_code=422, content={"detail": jsonable_encoder(exc.errors())})
+
     # Health endpoint (no auth)
     @app.get("/health", response_model=HealthResponse, tags=["Health"])
     async def health() -> HealthResponse:
-        db_status: dict[str, str] = {}
-        for label, dsn in [
-            ("evaluation", settings.eval_dsn),
-            ("configuration", settings.config_dsn),
-            ("event_history", settings.event_dsn),
-        ]:
-            try:
-                import psycopg2
-                conn = psycopg2.connect(dsn, connect_timeout=3)
-                conn.close()
-                db_status[label] = "ok"
-            except Exception as exc:
-                db_status[label] = f"error: {exc}"
+        global _health_cache
+        now = time.monotonic()
+        if _health_cache is not None and now - _health_cache[0] < _HEALTH_TTL_SECONDS:
+            return HealthResponse(databases=_health_cache[1])
+
+        labels = ("evaluation", "configuration", "event_history")
+        results = await asyncio.gather(
+            ping(settings.eval_dsn),
+            ping(settings.config_dsn),
+            ping(settings.event_dsn),
+        )
+        db_status = dict(zip(labels, results))
+        _health_cache = (now, db_status)
         return HealthResponse(databases=db_status)
 
+    # /evaluate/raw documents its body by hand; publish the nested models
+    # that body schema refers to
+    def openapi() -> dict[str, Any]:
+        if app.openapi_schema is None:
+            schema = FastAPI.openapi(app)
+            schema.setdefault("components", {}).setdefault("schemas", {}).update(
+                entry.RAW_REQUEST_COMPONENTS
+            )
+        return app.openapi_schema
+
+    app.openapi = openapi
+
     # Mount routers
     app.include_router(dashboard.router)
     app.include_router(users_routes.router)
@@ -7,68 +7,306 @@ required by the Tazama TMS service.
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+import re
+import time
+from functools import lru_cache
+from secrets import token_hex
+from typing import Any, Callable, Literal
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import TypedDict
+
+# ISO 20022 timestamps here are second-resolution ("….000Z"), so the
+# formatted string only changes once a second — format it once per second.
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    global _ts_cache
+    now = int(time.time())
+    if _ts_cache[0] != now:
+        _ts_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(now)))
+    return _ts_cache[1]
 
 
 # ------------------------------------------------------------------ #
 #  ISO 20022  pacs.002 nested models
 # ------------------------------------------------------------------ #
 
+# Single-purpose wrappers are TypedDicts: pydantic validates them inline as
+# plain dicts, without a model class (and its validator/serializer) each.
+# Amount stays a model for its Ccy default.
+#
+# The models below are only ever validated as part of RawPacs002Request,
+# which compiles them into its own validator; defer_build keeps each one
+# from also compiling a standalone validator/serializer at import.
+_NESTED = ConfigDict(defer_build=True)
+
+
 class Amount(BaseModel):
-    Amt: float
+    model_config = _NESTED
+
+    Amt: float = Field(allow_inf_nan=False)
     Ccy: str = "USD"
 
 
-class MemberIdentification(BaseModel):
+class MemberIdentification(TypedDict):
     MmbId: str
 
 
-class ClearingSystemMember(BaseModel):
+class ClearingSystemMember(TypedDict):
     ClrSysMmbId: MemberIdentification
 
 
-class FinancialInstitutionId(BaseModel):
+class FinancialInstitutionId(TypedDict):
     FinInstnId: ClearingSystemMember
 
 
-class ChargeInfo(BaseModel):
+class ChargeInfo(TypedDict):
     Amt: Amount
     Agt: FinancialInstitutionId
 
 
 class TransactionStatus(BaseModel):
+    model_config = _NESTED
+
     OrgnlInstrId: str = Field(default_factory=lambda: uuid4().hex)
     OrgnlEndToEndId: str = Field(default_factory=lambda: uuid4().hex)
     TxSts: str = "ACCC"
     ChrgsInf: list[ChargeInfo] = []
-    AccptncDtTm: str = Field(
-        default_factory=lambda: datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.000Z")
-    )
+    AccptncDtTm: str = Field(default_factory=_now_iso)
     InstgAgt: FinancialInstitutionId | None = None
     InstdAgt: FinancialInstitutionId | None = None
 
 
 class GroupHeader(BaseModel):
+    model_config = _NESTED
+
     MsgId: str = Field(default_factory=lambda: uuid4().hex)
-    CreDtTm: str = Field(
-        default_factory=lambda: datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.000Z")
-    )
+    CreDtTm: str = Field(default_factory=_now_iso)
 
 
 class FIToFIPmtSts(BaseModel):
+    model_config = _NESTED
+
     GrpHdr: GroupHeader
     TxInfAndSts: TransactionStatus
 
 
 class Pacs002Payload(BaseModel):
     """Full pacs.002.001.12 body exactly as Tazama TMS expects."""
+    model_config = _NESTED
+
     FIToFIPmtSts: FIToFIPmtSts
 
 
+# ------------------------------------------------------------------ #
+#  Invariant pacs.008 / pacs.002 fragments
+# ------------------------------------------------------------------ #
+
+# Parts of the generated messages that never vary between requests. They
+# are shared by reference across every payload built below — payloads are
+# only ever serialized, never mutated, so nothing is copied per request.
+_SETTLEMENT_INFO = {"SttlmMtd": "CLRG"}
+_DEBTOR_BIRTH = {"BirthDt": "1990-01-01", "CityOfBirth": "Unknown", "CtryOfBirth": "ZZ"}
+_CREDITOR_BIRTH = {"BirthDt": "1985-06-15", "CityOfBirth": "Unknown", "CtryOfBirth": "ZZ"}
+_DEBTOR_CONTACT = {"MobNb": "+27-000000000"}
+_CREDITOR_CONTACT = {"MobNb": "+27-111111111"}
+_ENTITY_SCHEME = {"Prtry": "TAZAMA_EID"}
+_ACCOUNT_SCHEME = {"Prtry": "MSISDN"}
+_PURPOSE = {"Cd": "MP2P"}
+_REGULATORY_REPORTING = {"Dtls": {"Tp": "BALANCE OF PAYMENTS", "Cd": "100"}}
+_REMITTANCE_INFO = {"Ustrd": "Payment transfer"}
+_INITIATOR_GEOLOCATION = {"Glctn": {"Lat": "-3.1609", "Long": "38.3588"}}
+
+
+def _agent(member: str) -> dict[str, Any]:
+    return {"FinInstnId": {"ClrSysMmbId": {"MmbId": member}}}
+
+
+def _pacs008_tree(
+    *,
+    debtor: str,
+    creditor: str,
+    amount: Any,
+    currency: str,
+    msg_id: str,
+    instr_id: str,
+    e2e_id: str,
+    now: str,
+    debtor_entity_id: str,
+    creditor_entity_id: str,
+    debtor_acct_id: str,
+    creditor_acct_id: str,
+) -> dict[str, Any]:
+    debtor_agent = _agent(debtor)
+    instructed = {"Amt": {"Amt": amount, "Ccy": currency}}
+    debtor_party = {
+        "Nm": "Debtor Name",
+        "Id": {
+            "PrvtId": {
+                "DtAndPlcOfBirth": _DEBTOR_BIRTH,
+                "Othr": [{"Id": debtor_entity_id, "SchmeNm": _ENTITY_SCHEME}],
+            }
+        },
+        "CtctDtls": _DEBTOR_CONTACT,
+    }
+    return {
+        "TxTp": "pacs.008.001.10",
+        "FIToFICstmrCdtTrf": {
+            "GrpHdr": {
+                "MsgId": msg_id,
+                "CreDtTm": now,
+                "NbOfTxs": 1,
+                "SttlmInf": _SETTLEMENT_INFO,
+            },
+            "CdtTrfTxInf": {
+                "PmtId": {
+                    "InstrId": instr_id,
+                    "EndToEndId": e2e_id,
+                },
+                "IntrBkSttlmAmt": instructed,
+                "InstdAmt": instructed,
+                "XchgRate": "1",
+                "ChrgBr": "DEBT",
+                "ChrgsInf": {
+                    "Amt": {"Amt": 0, "Ccy": currency},
+                    "Agt": debtor_agent,
+                },
+                # The initiating party is the debtor itself
+                "InitgPty": debtor_party,
+                "Dbtr": debtor_party,
+                "DbtrAcct": {
+                    "Id": {"Othr": [{"Id": debtor_acct_id, "SchmeNm": _ACCOUNT_SCHEME}]},
+                    "Nm": "Debtor Account",
+                },
+                "DbtrAgt": debtor_agent,
+                "CdtrAgt": _agent(creditor),
+                "Cdtr": {
+                    "Nm": "Creditor Name",
+                    "Id": {
+                        "PrvtId": {
+                            "DtAndPlcOfBirth": _CREDITOR_BIRTH,
+                            "Othr": [{"Id": creditor_entity_id, "SchmeNm": _ENTITY_SCHEME}],
+                        }
+                    },
+                    "CtctDtls": _CREDITOR_CONTACT,
+                },
+                "CdtrAcct": {
+                    "Id": {"Othr": [{"Id": creditor_acct_id, "SchmeNm": _ACCOUNT_SCHEME}]},
+                    "Nm": "Creditor Account",
+                },
+                "Purp": _PURPOSE,
+            },
+            "RgltryRptg": _REGULATORY_REPORTING,
+            "RmtInf": _REMITTANCE_INFO,
+            "SplmtryData": {
+                "Envlp": {
+                    "Doc": {
+                        "Xprtn": now,
+                        "InitgPty": _INITIATOR_GEOLOCATION,
+                    }
+                }
+            },
+        },
+    }
+
+
+def _pacs002_tree(
+    *,
+    debtor: str,
+    creditor: str,
+    amount: Any,
+    currency: str,
+    status: str,
+    msg_id: str,
+    instr_id: str,
+    e2e_id: str,
+    now: str,
+) -> dict[str, Any]:
+    debtor_agent = _agent(debtor)
+    creditor_agent = _agent(creditor)
+    return {
+        "TxTp": "pacs.002.001.12",
+        "FIToFIPmtSts": {
+            "GrpHdr": {
+                "MsgId": msg_id,
+                "CreDtTm": now,
+            },
+            "TxInfAndSts": {
+                "OrgnlInstrId": instr_id,
+                "OrgnlEndToEndId": e2e_id,
+                "TxSts": status,
+                "ChrgsInf": [
+                    {"Amt": {"Amt": amount, "Ccy": currency}, "Agt": debtor_agent},
+                    {"Amt": {"Amt": 0, "Ccy": currency}, "Agt": debtor_agent},
+                    {"Amt": {"Amt": 0, "Ccy": currency}, "Agt": creditor_agent},
+                ],
+                "AccptncDtTm": now,
+                "InstgAgt": debtor_agent,
+                "InstdAgt": creditor_agent,
+            },
+        },
+    }
+
+
+def _byte_template(build: Callable[..., dict[str, Any]], fields: tuple[str, ...]) -> bytes:
+    """Serialize *build* once with a named ``%(field)b`` slot for every variable leaf."""
+    tree = build(**{f: f"@@{f}@@" for f in fields})
+    template = orjson.dumps(tree).replace(b"%", b"%%")
+    for f in fields:
+        template = template.replace(f'"@@{f}@@"'.encode(), f"%({f})b".encode())
+    return template
+
+
+# Filled with already-JSON-encoded values, so member IDs and currency codes
+# are escaped exactly as a full orjson.dumps of the tree would escape them.
+_PACS008_TEMPLATE = _byte_template(_pacs008_tree, (
+    "debtor", "creditor", "amount", "currency", "msg_id", "instr_id", "e2e_id", "now",
+    "debtor_entity_id", "creditor_entity_id", "debtor_acct_id", "creditor_acct_id",
+))
+_PACS002_TEMPLATE = _byte_template(_pacs002_tree, (
+    "debtor", "creditor", "amount", "currency", "status", "msg_id", "instr_id", "e2e_id", "now",
+))
+
+# Retries and repeat submissions reuse the same parties, amount and status,
+# so those slots are filled once per combination and only the IDs and
+# timestamp are substituted per request.
+_PACS008_STATIC = ("debtor", "creditor", "amount", "currency")
+_PACS002_STATIC = ("debtor", "creditor", "amount", "currency", "status")
+
+
+# Matches an escaped "%%" as well as a slot, so escapes are skipped over
+# rather than mistaken for the start of a slot.
+_SLOT = re.compile(rb"%%|%\((\w+)\)b")
+
+
+def _specialize(template: bytes, static: dict[str, Any]) -> bytes:
+    """Fill the *static* slots in one pass, leaving the others (and escapes) in place.
+
+    A single pass matters: a filled value such as ``%%(creditor)b`` must not
+    be scanned again for slots.
+    """
+    values = {k.encode(): orjson.dumps(v).replace(b"%", b"%%") for k, v in static.items()}
+
+    def fill(match: re.Match[bytes]) -> bytes:
+        return values.get(match.group(1), match.group(0))
+
+    return _SLOT.sub(fill, template)
+
+
+@lru_cache(maxsize=1024)
+def _pacs008_template(*static: Any) -> bytes:
+    return _specialize(_PACS008_TEMPLATE, dict(zip(_PACS008_STATIC, static)))
+
+
+@lru_cache(maxsize=1024)
+def _pacs002_template(*static: Any) -> bytes:
+    return _specialize(_PACS002_TEMPLATE, dict(zip(_PACS002_STATIC, static)))
+
+
 # ------------------------------------------------------------------ #
 #  Simplified entry request — our friendly wrapper
 # ------------------------------------------------------------------ #
@@ -84,17 +322,47 @@ class SimpleTransactionRequest(BaseModel):
     creditor_member: str = Field(
         ..., description="DFSP / member ID of the creditor (receiver)", examples=["dfsp002"]
     )
-    amount: float = Field(..., gt=0, description="Transaction amount", examples=[100.50])
+    amount: float = Field(
+        ..., gt=0, allow_inf_nan=False, description="Transaction amount", examples=[100.50]
+    )
     currency: str = Field(default="USD", description="ISO 4217 currency code")
-    status: str = Field(
+    status: Literal["ACCC", "RJCT"] = Field(
         default="ACCC",
         description="Transaction status: ACCC (accepted) or RJCT (rejected)",
-        pattern="^(ACCC|RJCT)$",
     )
     tenant_id: str | None = Field(
         default=None, description="Tenant ID (defaults to server setting)"
     )
 
+    def _pacs008_values(self, end_to_end_id: str | None) -> dict[str, Any]:
+        return {
+            "debtor": self.debtor_member,
+            "creditor": self.creditor_member,
+            "amount": self.amount,
+            "currency": self.currency,
+            "msg_id": token_hex(16),
+            "instr_id": token_hex(16),
+            "e2e_id": end_to_end_id or token_hex(16),
+            "now": _now_iso(),
+            "debtor_entity_id": token_hex(16),
+            "creditor_entity_id": token_hex(16),
+            "debtor_acct_id": token_hex(16),
+            "creditor_acct_id": token_hex(16),
+        }
+
+    def _pacs002_values(self, end_to_end_id: str | None) -> dict[str, Any]:
+        return {
+            "debtor": self.debtor_member,
+            "creditor": self.creditor_member,
+            "amount": self.amount,
+            "currency": self.currency,
+            "status": self.status,
+            "msg_id": token_hex(16),
+            "instr_id": token_hex(16),
+            "e2e_id": end_to_end_id or token_hex(16),
+            "now": _now_iso(),
+        }
+
     def to_pacs008(self, tenant_id: str, end_to_end_id: str | None = None) -> dict[str, Any]:
         """Build the pacs.008 (credit transfer) that must be sent BEFORE pacs.002.
 
@@ -102,102 +370,7 @@ class SimpleTransactionRequest(BaseModel):
         ``"not": {"required": ["TenantId"]}`` and the middleware sets
         TenantId from the auth header / x-tenant-id header instead.
         """
-        now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.000Z")
-        e2e_id = end_to_end_id or uuid4().hex
-        debtor_entity_id = uuid4().hex
-        creditor_entity_id = uuid4().hex
-        debtor_acct_id = uuid4().hex
-        creditor_acct_id = uuid4().hex
-        return {
-            "TxTp": "pacs.008.001.10",
-            "FIToFICstmrCdtTrf": {
-                "GrpHdr": {
-                    "MsgId": uuid4().hex,
-                    "CreDtTm": now,
-                    "NbOfTxs": 1,
-                    "SttlmInf": {"SttlmMtd": "CLRG"},
-                },
-                "CdtTrfTxInf": {
-                    "PmtId": {
-                        "InstrId": uuid4().hex,
-                        "EndToEndId": e2e_id,
-                    },
-                    "IntrBkSttlmAmt": {"Amt": {"Amt": self.amount, "Ccy": self.currency}},
-                    "InstdAmt": {"Amt": {"Amt": self.amount, "Ccy": self.currency}},
-                    "XchgRate": "1",
-                    "ChrgBr": "DEBT",
-                    "ChrgsInf": {
-                        "Amt": {"Amt": 0, "Ccy": self.currency},
-                        "Agt": {"FinInstnId": {"ClrSysMmbId": {"MmbId": self.debtor_member}}},
-                    },
-                    "InitgPty": {
-                        "Nm": "Debtor Name",
-                        "Id": {
-                            "PrvtId": {
-                                "DtAndPlcOfBirth": {
-                                    "BirthDt": "1990-01-01",
-                                    "CityOfBirth": "Unknown",
-                                    "CtryOfBirth": "ZZ",
-                                },
-                                "Othr": [{"Id": debtor_entity_id, "SchmeNm": {"Prtry": "TAZAMA_EID"}}],
-                            }
-                        },
-                        "CtctDtls": {"MobNb": "+27-000000000"},
-                    },
-                    "Dbtr": {
-                        "Nm": "Debtor Name",
-                        "Id": {
-                            "PrvtId": {
-                                "DtAndPlcOfBirth": {
-                                    "BirthDt": "1990-01-01",
-                                    "CityOfBirth": "Unknown",
-                                    "CtryOfBirth": "ZZ",
-                                },
-                                "Othr": [{"Id": debtor_entity_id, "SchmeNm": {"Prtry": "TAZAMA_EID"}}],
-                            }
-                        },
-                        "CtctDtls": {"MobNb": "+27-000000000"},
-                    },
-                    "DbtrAcct": {
-                        "Id": {"Othr": [{"Id": debtor_acct_id, "SchmeNm": {"Prtry": "MSISDN"}}]},
-                        "Nm": "Debtor Account",
-                    },
-                    "DbtrAgt": {"FinInstnId": {"ClrSysMmbId": {"MmbId": self.debtor_member}}},
-                    "CdtrAgt": {"FinInstnId": {"ClrSysMmbId": {"MmbId": self.creditor_member}}},
-                    "Cdtr": {
-                        "Nm": "Creditor Name",
-                        "Id": {
-                            "PrvtId": {
-                                "DtAndPlcOfBirth": {
-                                    "BirthDt": "1985-06-15",
-                                    "CityOfBirth": "Unknown",
-                                    "CtryOfBirth": "ZZ",
-                                },
-                                "Othr": [{"Id": creditor_entity_id, "SchmeNm": {"Prtry": "TAZAMA_EID"}}],
-                            }
-                        },
-                        "CtctDtls": {"MobNb": "+27-111111111"},
-                    },
-                    "CdtrAcct": {
-                        "Id": {"Othr": [{"Id": creditor_acct_id, "SchmeNm": {"Prtry": "MSISDN"}}]},
-                        "Nm": "Creditor Account",
-                    },
-                    "Purp": {"Cd": "MP2P"},
-                },
-                "RgltryRptg": {"Dtls": {"Tp": "BALANCE OF PAYMENTS", "Cd": "100"}},
-                "RmtInf": {"Ustrd": "Payment transfer"},
-                "SplmtryData": {
-                    "Envlp": {
-                        "Doc": {
-                            "Xprtn": now,
-                            "InitgPty": {
-                                "Glctn": {"Lat": "-3.1609", "Long": "38.3588"},
-                            },
-                        }
-                    }
-                },
-            },
-        }
+        return _pacs008_tree(**self._pacs008_values(end_to_end_id))
 
     def to_pacs002(self, tenant_id: str, end_to_end_id: str | None = None) -> dict[str, Any]:
         """Convert to the full pacs.002 dict that TMS expects.
@@ -206,40 +379,19 @@ class SimpleTransactionRequest(BaseModel):
         ``"not": {"required": ["TenantId"]}`` and the middleware sets
         TenantId from the auth header / x-tenant-id header instead.
         """
-        now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.000Z")
-        msg_id = uuid4().hex
-        e2e_id = end_to_end_id or uuid4().hex
-        return {
-            "TxTp": "pacs.002.001.12",
-            "FIToFIPmtSts": {
-                "GrpHdr": {
-                    "MsgId": msg_id,
-                    "CreDtTm": now,
-                },
-                "TxInfAndSts": {
-                    "OrgnlInstrId": uuid4().hex,
-                    "OrgnlEndToEndId": e2e_id,
-                    "TxSts": self.status,
-                    "ChrgsInf": [
-                        {
-                            "Amt": {"Amt": self.amount, "Ccy": self.currency},
-                            "Agt": {"FinInstnId": {"ClrSysMmbId": {"MmbId": self.debtor_member}}},
-                        },
-                        {
-                            "Amt": {"Amt": 0, "Ccy": self.currency},
-                            "Agt": {"FinInstnId": {"ClrSysMmbId": {"MmbId": self.debtor_member}}},
-                        },
-                        {
-                            "Amt": {"Amt": 0, "Ccy": self.currency},
-                            "Agt": {"FinInstnId": {"ClrSysMmbId": {"MmbId": self.creditor_member}}},
-                        },
-                    ],
-                    "AccptncDtTm": now,
-                    "InstgAgt": {"FinInstnId": {"ClrSysMmbId": {"MmbId": self.debtor_member}}},
-                    "InstdAgt": {"FinInstnId": {"ClrSysMmbId": {"MmbId": self.creditor_member}}},
-                },
-            },
-        }
+        return _pacs002_tree(**self._pacs002_values(end_to_end_id))
+
+    def to_pacs008_bytes(self, tenant_id: str, end_to_end_id: str | None = None) -> tuple[bytes, str]:
+        """Serialized :meth:`to_pacs008`, plus its MsgId, filled into the byte template."""
+        values = self._pacs008_values(end_to_end_id)
+        template = _pacs008_template(*(values.pop(k) for k in _PACS008_STATIC))
+        return template % {k.encode(): orjson.dumps(v) for k, v in values.items()}, values["msg_id"]
+
+    def to_pacs002_bytes(self, tenant_id: str, end_to_end_id: str | None = None) -> tuple[bytes, str]:
+        """Serialized :meth:`to_pacs002`, plus its MsgId, filled into the byte template."""
+        values = self._pacs002_values(end_to_end_id)
+        template = _pacs002_template(*(values.pop(k) for k in _PACS002_STATIC))
+        return template % {k.encode(): orjson.dumps(v) for k, v in values.items()}, values["msg_id"]
 
     def resolved_tenant(self, fallback: str) -> str:
         return self.tenant_id or fallback
@@ -283,6 +435,7 @@ class EvaluationListResponse(BaseModel):
     total: int
     page: int
     per_page: int
+    next_cursor: str | None = None
     results: list[EvaluationDetail]
 
 
@@ -294,6 +447,10 @@ class StatsResponse(BaseModel):
     event_history_transactions: int
 
 
+class DashboardResponse(StatsResponse):
+    recent: list[EvaluationDetail]
+
+
 class HealthResponse(BaseModel):
     status: str = "ok"
     service: str = "lipana-tps"
@@ -6,26 +6,72 @@ and the transaction test page.
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 from pathlib import Path
 
-from fastapi import APIRouter, Request
+import brotli
+from fastapi import APIRouter, Request, Response
 from fastapi.responses import HTMLResponse
 
 router = APIRouter(tags=["Dashboard"])
 
+# Templates are static: read them as bytes once, compress them once, and
+# derive an ETag per encoding so repeat visitors get a 304 instead of the
+# full page and GZipMiddleware never re-compresses them per request.
 _TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
-_LOGIN_TEMPLATE = (_TEMPLATES_DIR / "login.html").read_text()
-_DASHBOARD_TEMPLATE = (_TEMPLATES_DIR / "dashboard_new.html").read_text()
+
+_HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+_CACHE_CONTROL = "public, max-age=300"
+
+
+def _variants(body: bytes) -> dict[str, tuple[bytes, str]]:
+    """Map content-coding to ``(body, etag)``, best coding first."""
+    digest = hashlib.md5(body, usedforsecurity=False).hexdigest()
+    variants: dict[str, tuple[bytes, str]] = {}
+    variants["br"] = (brotli.compress(body, quality=11), f'"{digest}-br"')
+    variants["gzip"] = (gzip.compress(body, 9, mtime=0), f'"{digest}-gzip"')
+    variants["identity"] = (body, f'"{digest}"')
+    return variants
+
+
+_LOGIN = _variants((_TEMPLATES_DIR / "login.html").read_bytes())
+_DASHBOARD = _variants((_TEMPLATES_DIR / "dashboard_new.html").read_bytes())
+
+
+def _accepted_codings(header: str) -> set[str]:
+    codings = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        if params.replace(" ", "").lower() in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        codings.add(coding.strip().lower())
+    return codings
+
+
+def _page(request: Request, variants: dict[str, tuple[bytes, str]]) -> Response:
+    """Serve a pre-compressed page, or 304 if the client already has it."""
+    accepted = _accepted_codings(request.headers.get("accept-encoding", ""))
+    coding = next((c for c in variants if c in accepted), "identity")
+    body, etag = variants[coding]
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    if coding != "identity":
+        headers["Content-Encoding"] = coding
+    return Response(content=body, media_type=_HTML_MEDIA_TYPE, headers=headers)
 
 
 @router.get("/", response_class=HTMLResponse, include_in_schema=False)
-async def login_page(request: Request) -> HTMLResponse:
+async def login_page(request: Request) -> Response:
     """Landing page — email/password authentication."""
-    return HTMLResponse(_LOGIN_TEMPLATE)
+    return _page(request, _LOGIN)
 
 
 @router.get("/dashboard", response_class=HTMLResponse, include_in_schema=False)
-async def dashboard(request: Request) -> HTMLResponse:
+async def dashboard(request: Request) -> Response:
     """Main dashboard SPA."""
-    return HTMLResponse(_DASHBOARD_TEMPLATE)
-
+    return _page(request, _DASHBOARD)
@@ -8,15 +8,21 @@ POST /api/v1/transactions/evaluate/raw  → pass-through raw pacs.002
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from secrets import token_hex
 from typing import Any
 
 import httpx
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from app.auth import require_api_key, require_session_with_api_key
 from app.config import settings
 from app.models import (
+    Pacs002Payload,
     RawPacs002Request,
     SimpleTransactionRequest,
     TransactionSubmitResponse,
@@ -25,18 +31,89 @@ from app.models import (
 logger = logging.getLogger("lipana.entry")
 router = APIRouter(prefix="/api/v1/transactions", tags=["Entry — Submit"])
 
+# Serializes an already-validated raw pacs.002 straight to JSON bytes
+_PACS002_ADAPTER = TypeAdapter(Pacs002Payload)
 
-async def _forward_to_tms(payload: dict[str, Any], tenant_id: str, msg_type: str = "pacs.002.001.12") -> dict:
-    """POST an ISO 20022 payload to the Tazama TMS service."""
-    url = f"{settings.tms_base_url}/v1/evaluate/iso20022/{msg_type}"
+# /evaluate/raw validates its body straight from the request bytes, so
+# its schema is documented by hand rather than through a body parameter.
+# The nested models' schemas are published as OpenAPI components by
+# create_app, which the request schema refers to.
+_RAW_REQUEST_ADAPTER = TypeAdapter(RawPacs002Request)
+_RAW_REQUEST_SCHEMA = RawPacs002Request.model_json_schema(
+    ref_template="#/components/schemas/{model}",
+)
+RAW_REQUEST_COMPONENTS: dict[str, Any] = _RAW_REQUEST_SCHEMA.pop("$defs", {})
+
+_RAW_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _RAW_REQUEST_SCHEMA}},
+    },
+}
+
+
+def get_tms_client(request: Request) -> httpx.AsyncClient:
+    """The shared TMS client opened by the app lifespan."""
+    return request.app.state.tms_client
+
+
+def _tms_request(
+    client: httpx.AsyncClient, payload: bytes, tenant_id: str, msg_type: str,
+) -> httpx.Request:
     headers = {
         "Content-Type": "application/json",
         "x-tenant-id": tenant_id,
     }
-    async with httpx.AsyncClient(timeout=settings.tms_timeout) as client:
-        resp = await client.post(url, json=payload, headers=headers)
+    return client.build_request(
+        "POST", f"/v1/evaluate/iso20022/{msg_type}", content=payload, headers=headers,
+    )
+
+
+async def _forward_to_tms(
+    client: httpx.AsyncClient,
+    payload: bytes,
+    tenant_id: str,
+    msg_type: str = "pacs.002.001.12",
+) -> dict:
+    """POST a serialized ISO 20022 payload to the Tazama TMS service."""
+    resp = await client.send(_tms_request(client, payload, tenant_id, msg_type))
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
+
+
+# Body-drain tasks for accepted pacs.008 responses, held so they are not
+# garbage-collected before they finish.
+_drain_tasks: set[asyncio.Task] = set()
+
+
+async def _drain(resp: httpx.Response) -> None:
+    try:
+        await resp.aread()
+    except httpx.HTTPError as exc:
+        logger.warning("Reading pacs.008 response body failed: %s", exc)
+    finally:
+        await resp.aclose()
+
+
+async def _send_pacs008(client: httpx.AsyncClient, payload: bytes, tenant_id: str) -> None:
+    """Send a pacs.008 and return as soon as TMS has answered with its status.
+
+    TMS has finished with the credit transfer once it sends the status line,
+    so the pacs.002 can go out while the (unused) body is still arriving.
+    Error responses are read in full and raised as HTTPStatusError.
+    """
+    resp = await client.send(
+        _tms_request(client, payload, tenant_id, "pacs.008.001.10"), stream=True,
+    )
+    if resp.is_error:
+        try:
+            await resp.aread()
+        finally:
+            await resp.aclose()
         resp.raise_for_status()
-        return resp.json()
+    task = asyncio.create_task(_drain(resp))
+    _drain_tasks.add(task)
+    task.add_done_callback(_drain_tasks.discard)
 
 
 @router.post(
@@ -51,21 +128,19 @@ async def _forward_to_tms(payload: dict[str, Any], tenant_id: str, msg_type: str
 )
 async def evaluate_simple(
     body: SimpleTransactionRequest,
+    client: httpx.AsyncClient = Depends(get_tms_client),
     _key: str = Depends(require_session_with_api_key),
 ) -> TransactionSubmitResponse:
-    from uuid import uuid4
-
     tenant = body.resolved_tenant(settings.default_tenant_id)
     # Shared EndToEndId links the pacs.008 and pacs.002 together
-    end_to_end_id = uuid4().hex
+    end_to_end_id = token_hex(16)
 
     # Step 1: Send pacs.008 (credit transfer) — creates accounts/entities
-    pacs008 = body.to_pacs008(tenant, end_to_end_id)
-    pacs008_msg_id = pacs008["FIToFICstmrCdtTrf"]["GrpHdr"]["MsgId"]
+    pacs008, pacs008_msg_id = body.to_pacs008_bytes(tenant, end_to_end_id)
     logger.info("Step 1: Sending pacs.008 %s for tenant %s", pacs008_msg_id, tenant)
 
     try:
-        pacs008_resp = await _forward_to_tms(pacs008, tenant, "pacs.008.001.10")
+        await _send_pacs008(client, pacs008, tenant)
         logger.info("pacs.008 accepted by TMS: %s", pacs008_msg_id)
     except httpx.HTTPStatusError as exc:
         error_detail = exc.response.text
@@ -75,7 +150,7 @@ async def evaluate_simple(
         except Exception:
             pass
         logger.error("TMS pacs.008 returned %s: %s", exc.response.status_code, error_detail)
-        return TransactionSubmitResponse(
+        return TransactionSubmitResponse.model_construct(
             success=False,
             message=f"TMS rejected pacs.008 (step 1): {error_detail}",
             msg_id=pacs008_msg_id,
@@ -84,7 +159,7 @@ async def evaluate_simple(
         )
     except httpx.RequestError as exc:
         logger.error("Failed to reach TMS for pacs.008: %s", exc)
-        return TransactionSubmitResponse(
+        return TransactionSubmitResponse.model_construct(
             success=False,
             message=f"Cannot reach TMS at {settings.tms_base_url}: {exc}",
             msg_id=pacs008_msg_id,
@@ -92,13 +167,12 @@ async def evaluate_simple(
         )
 
     # Step 2: Send pacs.002 (payment status) — triggers evaluation
-    pacs002 = body.to_pacs002(tenant, end_to_end_id)
-    msg_id = pacs002["FIToFIPmtSts"]["GrpHdr"]["MsgId"]
+    pacs002, msg_id = body.to_pacs002_bytes(tenant, end_to_end_id)
     logger.info("Step 2: Sending pacs.002 %s for tenant %s (E2E: %s)", msg_id, tenant, end_to_end_id)
 
     try:
-        tms_resp = await _forward_to_tms(pacs002, tenant, "pacs.002.001.12")
-        return TransactionSubmitResponse(
+        tms_resp = await _forward_to_tms(client, pacs002, tenant, "pacs.002.001.12")
+        return TransactionSubmitResponse.model_construct(
             success=True,
             message="Transaction accepted — submitted to Tazama pipeline for evaluation",
             msg_id=msg_id,
@@ -114,7 +188,7 @@ async def evaluate_simple(
         except Exception:
             pass
         logger.error("TMS pacs.002 returned %s: %s", exc.response.status_code, error_detail)
-        return TransactionSubmitResponse(
+        return TransactionSubmitResponse.model_construct(
             success=False,
             message=f"TMS rejected pacs.002 (step 2): {error_detail}",
             msg_id=msg_id,
@@ -124,7 +198,7 @@ async def evaluate_simple(
         )
     except httpx.RequestError as exc:
         logger.error("Failed to reach TMS for pacs.002: %s", exc)
-        return TransactionSubmitResponse(
+        return TransactionSubmitResponse.model_construct(
             success=False,
             message=f"Cannot reach TMS at {settings.tms_base_url}: {exc}",
             msg_id=msg_id,
@@ -145,10 +219,8 @@ async def preview_payloads(
     body: SimpleTransactionRequest,
     _key: str = Depends(require_session_with_api_key),
 ) -> dict:
-    from uuid import uuid4
-
     tenant = body.resolved_tenant(settings.default_tenant_id)
-    end_to_end_id = uuid4().hex
+    end_to_end_id = token_hex(16)
 
     pacs008 = body.to_pacs008(tenant, end_to_end_id)
     pacs002 = body.to_pacs002(tenant, end_to_end_id)
@@ -164,6 +236,7 @@ async def preview_payloads(
 @router.post(
     "/evaluate/raw",
     response_model=TransactionSubmitResponse,
+    openapi_extra=_RAW_REQUEST_BODY,
     summary="Evaluate a transaction (raw pacs.002)",
     description=(
         "Pass a raw ISO 20022 pacs.002.001.12 payload directly to TMS "
@@ -171,18 +244,29 @@ async def preview_payloads(
     ),
 )
 async def evaluate_raw(
-    body: RawPacs002Request,
+    request: Request,
+    client: httpx.AsyncClient = Depends(get_tms_client),
     _key: str = Depends(require_session_with_api_key),
 ) -> TransactionSubmitResponse:
+    raw = await request.body()
+    try:
+        body = _RAW_REQUEST_ADAPTER.validate_json(raw)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+        ) from exc
+
     tenant = body.tenant_id or settings.default_tenant_id
-    payload = body.payload.model_dump(by_alias=True)
-    msg_id = payload["FIToFIPmtSts"]["GrpHdr"]["MsgId"]
+    msg_id = body.payload.FIToFIPmtSts.GrpHdr.MsgId
+    # Serialize what was validated (generated IDs/timestamps included)
+    # straight to bytes, without an intermediate dict
+    payload = _PACS002_ADAPTER.dump_json(body.payload, by_alias=True)
 
     logger.info("Submitting raw pacs.002 %s for tenant %s", msg_id, tenant)
 
     try:
-        tms_resp = await _forward_to_tms(payload, tenant)
-        return TransactionSubmitResponse(
+        tms_resp = await _forward_to_tms(client, payload, tenant)
+        return TransactionSubmitResponse.model_construct(
             success=True,
             message="Raw pacs.002 submitted to Tazama pipeline",
             msg_id=msg_id,
@@ -190,7 +274,7 @@ async def evaluate_raw(
         )
     except httpx.HTTPStatusError as exc:
         logger.error("TMS returned %s: %s", exc.response.status_code, exc.response.text)
-        return TransactionSubmitResponse(
+        return TransactionSubmitResponse.model_construct(
             success=False,
             message=f"TMS error: {exc.response.status_code}",
             msg_id=msg_id,
@@ -198,7 +282,7 @@ async def evaluate_raw(
         )
     except httpx.RequestError as exc:
         logger.error("Failed to reach TMS: %s", exc)
-        return TransactionSubmitResponse(
+        return TransactionSubmitResponse.model_construct(
             success=False,
             message=f"Cannot reach TMS at {settings.tms_base_url}: {exc}",
             msg_id=msg_id,
@@ -2,9 +2,10 @@
 """
 Exit routes — retrieve evaluation results from the Tazama pipeline.
 
-GET  /api/v1/results                  → paginated list
+GET  /api/v1/results                  → paginated list (page or ?after= cursor)
 GET  /api/v1/results/{msg_id}         → single evaluation by MsgId
 GET  /api/v1/results/stats/summary    → aggregate counters
+GET  /api/v1/results/stats/dashboard  → counters + recent results in one call
 """
 
 from __future__ import annotations
@@ -12,18 +13,20 @@ from __future__ import annotations
 import asyncio
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from app.auth import require_api_key, require_session_with_api_key
 from app.config import settings
 from app.database import (
     count_evaluations,
     count_transactions,
+    get_dashboard_bundle,
     get_evaluation_by_msg_id,
-    list_evaluations,
+    list_and_count_evaluations,
 )
 from app.models import (
-    EvaluationDetail,
+    DashboardResponse,
     EvaluationListResponse,
     StatsResponse,
 )
@@ -32,32 +35,49 @@ logger = logging.getLogger("lipana.exit")
 router = APIRouter(prefix="/api/v1/results", tags=["Exit — Results"])
 
 
+def _embed_typologies(rows: list[dict]) -> None:
+    """Typology results arrive as JSON text — embed them as-is."""
+    for row in rows:
+        typology_json = row.pop("typology_results_json")
+        row["typology_results"] = orjson.Fragment(typology_json) if typology_json is not None else None
+
+
 @router.get(
     "",
     response_model=EvaluationListResponse,
     summary="List evaluation results",
-    description="Paginated list of all evaluation results for a tenant.",
+    description=(
+        "Paginated list of all evaluation results for a tenant. Pass the previous "
+        "response's next_cursor as `after` to seek to the next page instead of "
+        "using `page`."
+    ),
 )
 async def list_results(
     tenant_id: str = Query(default=None, description="Override tenant ID"),
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
     status: str | None = Query(default=None, description="Filter by ALRT or NALT"),
+    after: str | None = Query(default=None, description="next_cursor from the previous page"),
     _key: str = Depends(require_session_with_api_key),
-) -> EvaluationListResponse:
+) -> Response:
     tid = tenant_id or settings.default_tenant_id
     offset = (page - 1) * per_page
 
-    rows = list_evaluations(tid, limit=per_page, offset=offset, status_filter=status)
-    counts = count_evaluations(tid, status_filter=status)
-
-    return EvaluationListResponse(
-        tenant_id=tid,
-        total=counts.get("total", 0),
-        page=page,
-        per_page=per_page,
-        results=[EvaluationDetail(**r) for r in rows],
+    rows, counts = await list_and_count_evaluations(
+        tid, limit=per_page, offset=offset, status_filter=status, after_id=after,
     )
+    next_cursor = rows[-1]["msg_id"] if len(rows) == per_page else None
+    _embed_typologies(rows)
+
+    body = {
+        "tenant_id": tid,
+        "total": counts.get("total", 0),
+        "page": page,
+        "per_page": per_page,
+        "next_cursor": next_cursor,
+        "results": rows,
+    }
+    return Response(orjson.dumps(body), media_type="application/json")
 
 
 @router.get(
@@ -71,10 +91,10 @@ async def stats_summary(
     _key: str = Depends(require_session_with_api_key),
 ) -> StatsResponse:
     tid = tenant_id or settings.default_tenant_id
-    counts = count_evaluations(tid)
-    tx_count = count_transactions(tid)
+    # Evaluation and event-history counts live in different databases
+    counts, tx_count = await asyncio.gather(count_evaluations(tid), count_transactions(tid))
 
-    return StatsResponse(
+    return StatsResponse.model_construct(
         tenant_id=tid,
         evaluations_total=counts.get("total", 0),
         alerts=counts.get("alerts", 0),
@@ -83,6 +103,34 @@ async def stats_summary(
     )
 
 
+@router.get(
+    "/stats/dashboard",
+    response_model=DashboardResponse,
+    summary="Dashboard overview",
+    description="Aggregate counts plus the most recent evaluations, fetched together.",
+)
+async def stats_dashboard(
+    tenant_id: str = Query(default=None),
+    recent: int = Query(default=8, ge=1, le=50),
+    _key: str = Depends(require_session_with_api_key),
+) -> Response:
+    tid = tenant_id or settings.default_tenant_id
+    bundle = await get_dashboard_bundle(tid, recent_limit=recent)
+    counts = bundle["counts"]
+    rows = bundle["recent"]
+    _embed_typologies(rows)
+
+    body = {
+        "tenant_id": tid,
+        "evaluations_total": counts.get("total", 0),
+        "alerts": counts.get("alerts", 0),
+        "no_alerts": counts.get("no_alerts", 0),
+        "event_history_transactions": bundle["transactions"],
+        "recent": rows,
+    }
+    return Response(orjson.dumps(body), media_type="application/json")
+
+
 @router.get(
     "/{msg_id}",
     summary="Get evaluation by Message ID",
@@ -103,7 +151,7 @@ async def get_result(
     delay = 2.0
 
     for attempt in range(max_attempts):
-        result = get_evaluation_by_msg_id(msg_id, tid)
+        result = await get_evaluation_by_msg_id(msg_id, tid)
         if result is not None:
             return {
                 "tenant_id": tid,
@@ -6,10 +6,20 @@ and configuration management for the Tazama pipeline components.
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
-from typing import Any
-
-from fastapi import APIRouter, Depends, HTTPException, Query
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Iterator, Literal
+
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from kubernetes import client as k8s_client, config as k8s_config
+from kubernetes.client.exceptions import ApiException
 
 from app.auth import require_api_key, require_session_with_api_key, require_admin
 from app.config import settings
@@ -20,98 +30,229 @@ router = APIRouter(prefix="/api/v1/system", tags=["System — Cluster Management
 
 # ── Kubernetes Client Helper ─────────────────────────────────
 
-def _get_k8s_clients():
-    """Get Kubernetes CoreV1Api and AppsV1Api clients."""
-    try:
-        from kubernetes import client, config as k8s_config
-
-        if settings.k8s_in_cluster:
-            try:
-                k8s_config.load_incluster_config()
-            except k8s_config.ConfigException:
-                # Fallback to kubeconfig for local dev
-                if settings.k8s_kubeconfig:
-                    k8s_config.load_kube_config(config_file=settings.k8s_kubeconfig)
-                else:
-                    k8s_config.load_kube_config()
-        else:
+# The kubernetes client is synchronous, so every API call below runs in a
+# worker thread via asyncio.to_thread rather than stalling the event loop.
+
+# Loading kubeconfig (and running any exec auth plugin) and building an
+# ApiClient with its own connection pool is far too costly to repeat per
+# request. Build the pair once and share it; rebuild after an hour so
+# rotated service-account tokens / certificates are picked up.
+_K8S_CLIENT_TTL_SECONDS = 3600.0
+_k8s_clients: tuple[Any, Any] | None = None
+_k8s_loaded_at = 0.0
+_k8s_clients_lock = threading.Lock()
+
+
+def _load_k8s_config(cfg: k8s_client.Configuration) -> None:
+    if settings.k8s_in_cluster:
+        try:
+            k8s_config.load_incluster_config(client_configuration=cfg)
+        except k8s_config.ConfigException:
+            # Fallback to kubeconfig for local dev
             if settings.k8s_kubeconfig:
-                k8s_config.load_kube_config(config_file=settings.k8s_kubeconfig)
+                k8s_config.load_kube_config(config_file=settings.k8s_kubeconfig, client_configuration=cfg)
             else:
-                k8s_config.load_kube_config()
+                k8s_config.load_kube_config(client_configuration=cfg)
+    else:
+        if settings.k8s_kubeconfig:
+            k8s_config.load_kube_config(config_file=settings.k8s_kubeconfig, client_configuration=cfg)
+        else:
+            k8s_config.load_kube_config(client_configuration=cfg)
 
-        core_v1 = client.CoreV1Api()
-        apps_v1 = client.AppsV1Api()
-        return core_v1, apps_v1
+
+def _get_k8s_clients():
+    """Get the shared Kubernetes CoreV1Api and AppsV1Api clients."""
+    global _k8s_clients, _k8s_loaded_at
+    if _k8s_clients is not None and time.monotonic() - _k8s_loaded_at < _K8S_CLIENT_TTL_SECONDS:
+        return _k8s_clients
+    with _k8s_clients_lock:
+        # Another worker thread may have rebuilt the pair while we waited
+        if _k8s_clients is not None and time.monotonic() - _k8s_loaded_at < _K8S_CLIENT_TTL_SECONDS:
+            return _k8s_clients
+        return _build_k8s_clients()
+
+
+def _build_k8s_clients():
+    global _k8s_clients, _k8s_loaded_at
+    try:
+        cfg = k8s_client.Configuration()
+        _load_k8s_config(cfg)
+        # Sized for concurrent /system calls sharing the one keep-alive pool
+        cfg.connection_pool_maxsize = settings.k8s_pool_size
+        api_client = k8s_client.ApiClient(configuration=cfg)
+        _k8s_clients = (k8s_client.CoreV1Api(api_client), k8s_client.AppsV1Api(api_client))
+        _k8s_loaded_at = time.monotonic()
+        return _k8s_clients
     except Exception as exc:
         logger.error("Failed to initialize Kubernetes client: %s", exc)
         raise HTTPException(status_code=503, detail=f"Kubernetes unavailable: {exc}")
 
 
+def _list_items(list_fn: Callable[..., Any], **kwargs: Any) -> list[dict[str, Any]]:
+    """Call a ``list_namespaced_*`` method and return its raw JSON items.
+
+    Deserializing a list into the client's generated model objects costs
+    far more than the request itself for a large namespace; the Python
+    client cannot decode protobuf, so take the undecoded JSON body and
+    parse it with orjson instead.
+    """
+    resp = list_fn(_preload_content=False, **kwargs)
+    try:
+        return orjson.loads(resp.data)["items"] or []
+    finally:
+        resp.release_conn()
+
+
+def _timestamp(value: str | None) -> str | None:
+    """RFC 3339 ``…Z`` → ``…+00:00``, matching what the typed client emitted."""
+    if value and value.endswith("Z"):
+        return value[:-1] + "+00:00"
+    return value
+
+
+def _api_error(exc: ApiException, action: str) -> HTTPException:
+    """Map an API-server error to an HTTPException carrying its status and reason.
+
+    ``str(exc)`` drags in the response headers and JSON body, so only the
+    reason is surfaced. A 401 means our credentials went stale: drop the
+    cached clients so the next request reloads them, and report 503 rather
+    than a 401 the dashboard would treat as its own session expiring.
+    """
+    global _k8s_clients
+    if exc.status == 401:
+        _k8s_clients = None
+        return HTTPException(status_code=503, detail=f"{action}: Kubernetes credentials rejected")
+    status_code = exc.status if exc.status and 400 <= exc.status < 600 else 503
+    return HTTPException(status_code=status_code, detail=f"{action}: {exc.reason}")
+
+
+def get_core_v1() -> k8s_client.CoreV1Api:
+    """Dependency: the shared CoreV1Api (503 if the cluster is unreachable).
+
+    Plain ``def`` so FastAPI resolves it in its threadpool: a (re)build
+    loads kubeconfig and may run an exec auth plugin, which must not block
+    the event loop.
+    """
+    return _get_k8s_clients()[0]
+
+
+def get_apps_v1() -> k8s_client.AppsV1Api:
+    """Dependency: the shared AppsV1Api (503 if the cluster is unreachable)."""
+    return _get_k8s_clients()[1]
+
+
+def warm_k8s_clients() -> None:
+    """Build the shared clients at startup so the first request doesn't pay for it."""
+    try:
+        _get_k8s_clients()
+    except HTTPException as exc:
+        logger.info("Kubernetes client warm-up skipped: %s", exc.detail)
+
+
+def close_k8s_clients() -> None:
+    global _k8s_clients
+    if _k8s_clients is not None:
+        _k8s_clients[0].api_client.close()
+        _k8s_clients = None
+
+
+# ── Read-only list cache ─────────────────────────────────────
+
+# Dashboards poll the list endpoints every few seconds; serve those polls
+# from one upstream fetch per window, cached as the encoded JSON body.
+# Concurrent misses for the same key wait on a single fetch, and any
+# mutation below clears the cache. Keys include caller-supplied selectors,
+# so misses are serialized on a fixed set of locks picked by key hash
+# rather than on a per-key lock that would never be freed.
+_LIST_CACHE_TTL_SECONDS = 3.0
+_list_cache: TTLCache = TTLCache(maxsize=64, ttl=_LIST_CACHE_TTL_SECONDS)
+_list_cache_locks = tuple(asyncio.Lock() for _ in range(16))
+
+
+async def _cached(key: tuple, build: Callable[[], Awaitable[dict[str, Any]]]) -> Response:
+    body = _list_cache.get(key)
+    state = "HIT"
+    if body is None:
+        async with _list_cache_locks[hash(key) % len(_list_cache_locks)]:
+            body = _list_cache.get(key)
+            if body is None:
+                body = _list_cache[key] = orjson.dumps(await build())
+                state = "MISS"
+    return Response(body, media_type="application/json", headers={"X-Cache": state})
+
+
 # ── Pod endpoints ────────────────────────────────────────────
 
-@router.get(
-    "/pods",
-    summary="List all pods",
-    description="List all pods in the Tazama Kubernetes namespace with status and resource details.",
-)
-async def list_pods(
-    _key: str = Depends(require_session_with_api_key),
-) -> dict[str, Any]:
-    core_v1, _ = _get_k8s_clients()
+def _selectors(label_selector: str | None, field_selector: str | None) -> dict[str, str]:
+    """Selector kwargs for a list call, omitting empty ones."""
+    selectors = {}
+    if label_selector:
+        selectors["label_selector"] = label_selector
+    if field_selector:
+        selectors["field_selector"] = field_selector
+    return selectors
+
+
+async def _pods_view(core_v1: k8s_client.CoreV1Api, selectors: dict[str, str]) -> dict[str, Any]:
     ns = settings.k8s_namespace
 
     try:
-        pods = core_v1.list_namespaced_pod(namespace=ns)
+        pods = await asyncio.to_thread(_list_items, core_v1.list_namespaced_pod, namespace=ns, **selectors)
+    except ApiException as exc:
+        raise _api_error(exc, "Failed to list pods") from None
     except Exception as exc:
         raise HTTPException(status_code=503, detail=f"Failed to list pods: {exc}")
 
     results = []
-    for pod in pods.items:
+    for pod in pods:
+        meta, spec, status = pod["metadata"], pod["spec"], pod.get("status", {})
         containers = []
-        for c in pod.spec.containers:
-            res = c.resources
+        for c in spec["containers"]:
+            res = c.get("resources") or {}
             containers.append({
-                "name": c.name,
-                "image": c.image,
+                "name": c["name"],
+                "image": c.get("image"),
                 "resources": {
-                    "requests": {k: str(v) for k, v in (res.requests or {}).items()} if res and res.requests else {},
-                    "limits": {k: str(v) for k, v in (res.limits or {}).items()} if res and res.limits else {},
+                    "requests": {k: str(v) for k, v in (res.get("requests") or {}).items()},
+                    "limits": {k: str(v) for k, v in (res.get("limits") or {}).items()},
                 },
             })
 
-        # Container statuses
+        # Container statuses, with ready/restart totals, in one pass
         container_statuses = []
-        for cs in (pod.status.container_statuses or []):
+        ready_count = restarts = 0
+        for cs in (status.get("containerStatuses") or []):
+            ready_count += cs["ready"]
+            restarts += cs["restartCount"]
+            cs_state = cs.get("state") or {}
             state = "unknown"
-            if cs.state.running:
+            if cs_state.get("running") is not None:
                 state = "running"
-            elif cs.state.waiting:
-                state = f"waiting: {cs.state.waiting.reason or 'unknown'}"
-            elif cs.state.terminated:
-                state = f"terminated: {cs.state.terminated.reason or 'unknown'}"
+            elif cs_state.get("waiting") is not None:
+                state = f"waiting: {cs_state['waiting'].get('reason') or 'unknown'}"
+            elif cs_state.get("terminated") is not None:
+                state = f"terminated: {cs_state['terminated'].get('reason') or 'unknown'}"
 
             container_statuses.append({
-                "name": cs.name,
-                "ready": cs.ready,
-                "restart_count": cs.restart_count,
+                "name": cs["name"],
+                "ready": cs["ready"],
+                "restart_count": cs["restartCount"],
                 "state": state,
-                "image": cs.image,
+                "image": cs["image"],
             })
 
-        ready_count = sum(1 for cs in (pod.status.container_statuses or []) if cs.ready)
-        total_count = len(pod.spec.containers)
+        total_count = len(spec["containers"])
 
         results.append({
-            "name": pod.metadata.name,
-            "namespace": pod.metadata.namespace,
-            "status": pod.status.phase,
+            "name": meta["name"],
+            "namespace": meta.get("namespace"),
+            "status": status.get("phase"),
             "ready": f"{ready_count}/{total_count}",
-            "restarts": sum(cs.restart_count for cs in (pod.status.container_statuses or [])),
-            "node": pod.spec.node_name,
-            "ip": pod.status.pod_ip,
-            "created": pod.metadata.creation_timestamp.isoformat() if pod.metadata.creation_timestamp else None,
-            "labels": dict(pod.metadata.labels or {}),
+            "restarts": restarts,
+            "node": spec.get("nodeName"),
+            "ip": status.get("podIP"),
+            "created": _timestamp(meta.get("creationTimestamp")),
+            "labels": meta.get("labels") or {},
             "containers": containers,
             "container_statuses": container_statuses,
         })
@@ -123,19 +264,55 @@ async def list_pods(
     }
 
 
+@router.get(
+    "/pods",
+    summary="List all pods",
+    description="List all pods in the Tazama Kubernetes namespace with status and resource details.",
+)
+async def list_pods(
+    label_selector: str | None = Query(
+        default=None, description="Kubernetes label selector (defaults to K8S_APP_LABEL_SELECTOR)",
+    ),
+    field_selector: str | None = Query(default=None, description="Kubernetes field selector, e.g. status.phase=Running"),
+    _key: str = Depends(require_session_with_api_key),
+    core_v1: k8s_client.CoreV1Api = Depends(get_core_v1),
+) -> Response:
+    # Filtering happens on the API server, so only matching pods cross the wire
+    selectors = _selectors(
+        settings.k8s_app_label_selector if label_selector is None else label_selector, field_selector,
+    )
+    key = ("pods", settings.k8s_namespace, tuple(selectors.items()))
+    return await _cached(key, lambda: _pods_view(core_v1, selectors))
+
+
+_LOG_CHUNK_SIZE = 64 * 1024
+
+
+def _stream_log(resp: Any) -> Iterator[bytes]:
+    try:
+        yield from resp.stream(_LOG_CHUNK_SIZE)
+    finally:
+        resp.release_conn()
+
+
 @router.get(
     "/pods/{pod_name}/logs",
+    response_model=None,
     summary="Get pod logs",
-    description="Retrieve logs from a specific pod. Optionally specify container name and tail lines.",
+    description=(
+        "Retrieve logs from a specific pod. Optionally specify container name and tail lines. "
+        "format=text streams the raw log as text/plain instead of returning a JSON line list."
+    ),
 )
 async def get_pod_logs(
     pod_name: str,
     container: str | None = Query(default=None, description="Container name (for multi-container pods)"),
     tail_lines: int = Query(default=200, ge=1, le=5000, description="Number of tail lines"),
     previous: bool = Query(default=False, description="Get logs from previous container instance"),
+    format: Literal["json", "text"] = Query(default="json", description="json (line list) or text (raw stream)"),
     _key: str = Depends(require_session_with_api_key),
-) -> dict[str, Any]:
-    core_v1, _ = _get_k8s_clients()
+    core_v1: k8s_client.CoreV1Api = Depends(get_core_v1),
+) -> Response:
     ns = settings.k8s_namespace
 
     try:
@@ -148,18 +325,30 @@ async def get_pod_logs(
         }
         if container:
             kwargs["container"] = container
+        if format == "text":
+            # Relay the body chunk by chunk as the API server sends it
+            kwargs["_preload_content"] = False
 
-        logs = core_v1.read_namespaced_pod_log(**kwargs)
+        logs = await asyncio.to_thread(core_v1.read_namespaced_pod_log, **kwargs)
+    except ApiException as exc:
+        raise _api_error(exc, "Failed to fetch logs") from None
     except Exception as exc:
         raise HTTPException(status_code=404, detail=f"Failed to fetch logs: {exc}")
 
-    return {
+    if format == "text":
+        return StreamingResponse(_stream_log(logs), media_type="text/plain; charset=utf-8")
+
+    # Encode straight to bytes: handing FastAPI the dict would walk every
+    # line through jsonable_encoder in Python before orjson ever saw it
+    lines = logs.split("\n") if logs else []
+    body = {
         "pod": pod_name,
         "container": container,
         "tail_lines": tail_lines,
-        "log_lines": logs.split("\n") if logs else [],
-        "total_lines": len(logs.split("\n")) if logs else 0,
+        "log_lines": lines,
+        "total_lines": len(lines),
     }
+    return Response(orjson.dumps(body), media_type="application/json")
 
 
 @router.post(
@@ -170,13 +359,16 @@ async def get_pod_logs(
 async def restart_pod(
     pod_name: str,
     _admin: dict = Depends(require_admin),
+    core_v1: k8s_client.CoreV1Api = Depends(get_core_v1),
 ) -> dict[str, Any]:
-    core_v1, _ = _get_k8s_clients()
     ns = settings.k8s_namespace
 
     try:
-        core_v1.delete_namespaced_pod(name=pod_name, namespace=ns)
+        await asyncio.to_thread(core_v1.delete_namespaced_pod, name=pod_name, namespace=ns)
         logger.info("Pod %s deleted (restart) in namespace %s", pod_name, ns)
+        _list_cache.clear()
+    except ApiException as exc:
+        raise _api_error(exc, "Failed to restart pod") from None
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to restart pod: {exc}")
 
@@ -189,33 +381,28 @@ async def restart_pod(
 
 # ── Deployment endpoints ─────────────────────────────────────
 
-@router.get(
-    "/deployments",
-    summary="List deployments",
-    description="List all deployments in the Tazama namespace with replica and image info.",
-)
-async def list_deployments(
-    _key: str = Depends(require_session_with_api_key),
-) -> dict[str, Any]:
-    _, apps_v1 = _get_k8s_clients()
+async def _deployments_view(apps_v1: k8s_client.AppsV1Api) -> dict[str, Any]:
     ns = settings.k8s_namespace
 
     try:
-        deploys = apps_v1.list_namespaced_deployment(namespace=ns)
+        deploys = await asyncio.to_thread(_list_items, apps_v1.list_namespaced_deployment, namespace=ns)
+    except ApiException as exc:
+        raise _api_error(exc, "Failed to list deployments") from None
     except Exception as exc:
         raise HTTPException(status_code=503, detail=f"Failed to list deployments: {exc}")
 
     results = []
-    for d in deploys.items:
+    for d in deploys:
+        meta, spec, status = d["metadata"], d["spec"], d.get("status", {})
         results.append({
-            "name": d.metadata.name,
-            "replicas": d.spec.replicas,
-            "ready_replicas": d.status.ready_replicas or 0,
-            "available_replicas": d.status.available_replicas or 0,
-            "updated_replicas": d.status.updated_replicas or 0,
-            "images": [c.image for c in d.spec.template.spec.containers],
-            "labels": dict(d.metadata.labels or {}),
-            "created": d.metadata.creation_timestamp.isoformat() if d.metadata.creation_timestamp else None,
+            "name": meta["name"],
+            "replicas": spec.get("replicas"),
+            "ready_replicas": status.get("readyReplicas") or 0,
+            "available_replicas": status.get("availableReplicas") or 0,
+            "updated_replicas": status.get("updatedReplicas") or 0,
+            "images": [c.get("image") for c in spec["template"]["spec"]["containers"]],
+            "labels": meta.get("labels") or {},
+            "created": _timestamp(meta.get("creationTimestamp")),
         })
 
     return {
@@ -225,6 +412,18 @@ async def list_deployments(
     }
 
 
+@router.get(
+    "/deployments",
+    summary="List deployments",
+    description="List all deployments in the Tazama namespace with replica and image info.",
+)
+async def list_deployments(
+    _key: str = Depends(require_session_with_api_key),
+    apps_v1: k8s_client.AppsV1Api = Depends(get_apps_v1),
+) -> Response:
+    return await _cached(("deployments", settings.k8s_namespace), lambda: _deployments_view(apps_v1))
+
+
 @router.post(
     "/deployments/{deploy_name}/scale",
     summary="Scale a deployment",
@@ -234,21 +433,24 @@ async def scale_deployment(
     deploy_name: str,
     replicas: int = Query(ge=0, le=10, description="Target replica count"),
     _admin: dict = Depends(require_admin),
+    apps_v1: k8s_client.AppsV1Api = Depends(get_apps_v1),
 ) -> dict[str, Any]:
-    _, apps_v1 = _get_k8s_clients()
     ns = settings.k8s_namespace
 
     try:
-        from kubernetes import client
-        body = client.V1Scale(
-            spec=client.V1ScaleSpec(replicas=replicas)
+        body = k8s_client.V1Scale(
+            spec=k8s_client.V1ScaleSpec(replicas=replicas)
         )
-        apps_v1.patch_namespaced_deployment_scale(
+        await asyncio.to_thread(
+            apps_v1.patch_namespaced_deployment_scale,
             name=deploy_name,
             namespace=ns,
             body=body,
         )
         logger.info("Deployment %s scaled to %d replicas", deploy_name, replicas)
+        _list_cache.clear()
+    except ApiException as exc:
+        raise _api_error(exc, "Failed to scale") from None
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to scale: {exc}")
 
@@ -268,12 +470,11 @@ async def scale_deployment(
 async def restart_deployment(
     deploy_name: str,
     _admin: dict = Depends(require_admin),
+    apps_v1: k8s_client.AppsV1Api = Depends(get_apps_v1),
 ) -> dict[str, Any]:
-    _, apps_v1 = _get_k8s_clients()
     ns = settings.k8s_namespace
 
     try:
-        from datetime import datetime, timezone
         now = datetime.now(timezone.utc).isoformat()
         body = {
             "spec": {
@@ -286,12 +487,16 @@ async def restart_deployment(
                 }
             }
         }
-        apps_v1.patch_namespaced_deployment(
+        await asyncio.to_thread(
+            apps_v1.patch_namespaced_deployment,
             name=deploy_name,
             namespace=ns,
             body=body,
         )
         logger.info("Deployment %s rolling restart triggered", deploy_name)
+        _list_cache.clear()
+    except ApiException as exc:
+        raise _api_error(exc, "Failed to restart deployment") from None
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to restart deployment: {exc}")
 
@@ -312,12 +517,12 @@ async def update_deployment_image(
     image: str = Query(description="New container image (e.g. myregistry/app:v2)"),
     container_name: str = Query(default=None, description="Container name to update (defaults to first)"),
     _admin: dict = Depends(require_admin),
+    apps_v1: k8s_client.AppsV1Api = Depends(get_apps_v1),
 ) -> dict[str, Any]:
-    _, apps_v1 = _get_k8s_clients()
     ns = settings.k8s_namespace
 
     try:
-        deploy = apps_v1.read_namespaced_deployment(name=deploy_name, namespace=ns)
+        deploy = await asyncio.to_thread(apps_v1.read_namespaced_deployment, name=deploy_name, namespace=ns)
 
         if container_name:
             updated = False
@@ -331,10 +536,13 @@ async def update_deployment_image(
         else:
             deploy.spec.template.spec.containers[0].image = image
 
-        apps_v1.replace_namespaced_deployment(name=deploy_name, namespace=ns, body=deploy)
+        await asyncio.to_thread(apps_v1.replace_namespaced_deployment, name=deploy_name, namespace=ns, body=deploy)
         logger.info("Deployment %s image updated to %s", deploy_name, image)
+        _list_cache.clear()
     except HTTPException:
         raise
+    except ApiException as exc:
+        raise _api_error(exc, "Failed to update image") from None
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to update image: {exc}")
 
@@ -348,41 +556,36 @@ async def update_deployment_image(
 
 # ── Services endpoint ────────────────────────────────────────
 
-@router.get(
-    "/services",
-    summary="List services",
-    description="List all Kubernetes services in the Tazama namespace.",
-)
-async def list_services(
-    _key: str = Depends(require_session_with_api_key),
-) -> dict[str, Any]:
-    core_v1, _ = _get_k8s_clients()
+async def _services_view(core_v1: k8s_client.CoreV1Api) -> dict[str, Any]:
     ns = settings.k8s_namespace
 
     try:
-        services = core_v1.list_namespaced_service(namespace=ns)
+        services = await asyncio.to_thread(_list_items, core_v1.list_namespaced_service, namespace=ns)
+    except ApiException as exc:
+        raise _api_error(exc, "Failed to list services") from None
     except Exception as exc:
         raise HTTPException(status_code=503, detail=f"Failed to list services: {exc}")
 
     results = []
-    for svc in services.items:
+    for svc in services:
+        meta, spec = svc["metadata"], svc.get("spec", {})
         ports = []
-        for p in (svc.spec.ports or []):
+        for p in (spec.get("ports") or []):
             ports.append({
-                "name": p.name,
-                "port": p.port,
-                "target_port": str(p.target_port),
-                "protocol": p.protocol,
-                "node_port": p.node_port,
+                "name": p.get("name"),
+                "port": p["port"],
+                "target_port": str(p.get("targetPort")),
+                "protocol": p.get("protocol"),
+                "node_port": p.get("nodePort"),
             })
 
         results.append({
-            "name": svc.metadata.name,
-            "type": svc.spec.type,
-            "cluster_ip": svc.spec.cluster_ip,
+            "name": meta["name"],
+            "type": spec.get("type"),
+            "cluster_ip": spec.get("clusterIP"),
             "ports": ports,
-            "selector": dict(svc.spec.selector or {}),
-            "created": svc.metadata.creation_timestamp.isoformat() if svc.metadata.creation_timestamp else None,
+            "selector": spec.get("selector") or {},
+            "created": _timestamp(meta.get("creationTimestamp")),
         })
 
     return {
@@ -392,31 +595,39 @@ async def list_services(
     }
 
 
-# ── Events endpoint ──────────────────────────────────────────
-
 @router.get(
-    "/events",
-    summary="Recent cluster events",
-    description="Get recent Kubernetes events in the Tazama namespace.",
+    "/services",
+    summary="List services",
+    description="List all Kubernetes services in the Tazama namespace.",
 )
-async def list_events(
-    limit: int = Query(default=50, ge=1, le=200),
+async def list_services(
     _key: str = Depends(require_session_with_api_key),
+    core_v1: k8s_client.CoreV1Api = Depends(get_core_v1),
+) -> Response:
+    return await _cached(("services", settings.k8s_namespace), lambda: _services_view(core_v1))
+
+
+# ── Events endpoint ──────────────────────────────────────────
+
+async def _events_view(
+    core_v1: k8s_client.CoreV1Api, limit: int, selectors: dict[str, str],
 ) -> dict[str, Any]:
-    core_v1, _ = _get_k8s_clients()
     ns = settings.k8s_namespace
 
     try:
-        events = core_v1.list_namespaced_event(namespace=ns)
+        events = await asyncio.to_thread(core_v1.list_namespaced_event, namespace=ns, **selectors)
+    except ApiException as exc:
+        raise _api_error(exc, "Failed to list events") from None
     except Exception as exc:
         raise HTTPException(status_code=503, detail=f"Failed to list events: {exc}")
 
-    # Sort by last timestamp (most recent first)
-    sorted_events = sorted(
+    # Most recent `limit` events by last timestamp — a bounded heap rather
+    # than sorting every event in the namespace
+    sorted_events = heapq.nlargest(
+        limit,
         events.items,
         key=lambda e: e.last_timestamp or e.metadata.creation_timestamp or "",
-        reverse=True,
-    )[:limit]
+    )
 
     results = []
     for ev in sorted_events:
@@ -429,8 +640,8 @@ async def list_events(
                 "name": ev.involved_object.name,
             },
             "count": ev.count,
-            "first_time": ev.first_timestamp.isoformat() if ev.first_timestamp else None,
-            "last_time": ev.last_timestamp.isoformat() if ev.last_timestamp else None,
+            "first_time": ev.first_timestamp,
+            "last_time": ev.last_timestamp,
             "source": ev.source.component if ev.source else None,
         })
 
@@ -441,55 +652,94 @@ async def list_events(
     }
 
 
-# ── Namespace resource summary ───────────────────────────────
-
 @router.get(
-    "/overview",
-    summary="Cluster overview",
-    description="High-level summary of the Tazama cluster: pod counts, deployment health, etc.",
+    "/events",
+    summary="Recent cluster events",
+    description="Get recent Kubernetes events in the Tazama namespace.",
 )
-async def cluster_overview(
+async def list_events(
+    limit: int = Query(default=50, ge=1, le=200),
+    label_selector: str | None = Query(default=None, description="Kubernetes label selector"),
+    field_selector: str | None = Query(
+        default=None, description="Kubernetes field selector, e.g. type=Warning or involvedObject.name=<pod>",
+    ),
     _key: str = Depends(require_session_with_api_key),
+    core_v1: k8s_client.CoreV1Api = Depends(get_core_v1),
+) -> Response:
+    # Events rarely carry workload labels, so the app label default is not applied here
+    selectors = _selectors(label_selector, field_selector)
+    key = ("events", settings.k8s_namespace, limit, tuple(selectors.items()))
+    return await _cached(key, lambda: _events_view(core_v1, limit, selectors))
+
+
+# ── Namespace resource summary ───────────────────────────────
+
+async def _overview_view(
+    core_v1: k8s_client.CoreV1Api, apps_v1: k8s_client.AppsV1Api,
 ) -> dict[str, Any]:
-    core_v1, apps_v1 = _get_k8s_clients()
     ns = settings.k8s_namespace
 
     try:
-        pods = core_v1.list_namespaced_pod(namespace=ns)
-        deploys = apps_v1.list_namespaced_deployment(namespace=ns)
-        services = core_v1.list_namespaced_service(namespace=ns)
+        pods, deploys, services = await asyncio.gather(
+            asyncio.to_thread(
+                _list_items, core_v1.list_namespaced_pod, namespace=ns,
+                **_selectors(settings.k8s_app_label_selector, None),
+            ),
+            asyncio.to_thread(_list_items, apps_v1.list_namespaced_deployment, namespace=ns),
+            asyncio.to_thread(_list_items, core_v1.list_namespaced_service, namespace=ns),
+        )
+    except ApiException as exc:
+        raise _api_error(exc, "Cluster query failed") from None
     except Exception as exc:
         raise HTTPException(status_code=503, detail=f"Cluster query failed: {exc}")
 
-    running = sum(1 for p in pods.items if p.status.phase == "Running")
-    pending = sum(1 for p in pods.items if p.status.phase == "Pending")
-    failed = sum(1 for p in pods.items if p.status.phase == "Failed")
-
-    total_restarts = sum(
-        sum(cs.restart_count for cs in (p.status.container_statuses or []))
-        for p in pods.items
-    )
-
-    healthy_deploys = sum(
-        1 for d in deploys.items
-        if (d.status.ready_replicas or 0) == (d.spec.replicas or 0) and d.spec.replicas > 0
-    )
+    running = pending = failed = total_restarts = 0
+    for p in pods:
+        pod_status = p.get("status", {})
+        phase = pod_status.get("phase")
+        if phase == "Running":
+            running += 1
+        elif phase == "Pending":
+            pending += 1
+        elif phase == "Failed":
+            failed += 1
+        for cs in (pod_status.get("containerStatuses") or []):
+            total_restarts += cs["restartCount"]
+
+    healthy_deploys = 0
+    for d in deploys:
+        replicas = d["spec"].get("replicas") or 0
+        if replicas > 0 and (d.get("status", {}).get("readyReplicas") or 0) == replicas:
+            healthy_deploys += 1
 
     return {
         "namespace": ns,
         "pods": {
-            "total": len(pods.items),
+            "total": len(pods),
             "running": running,
             "pending": pending,
             "failed": failed,
             "total_restarts": total_restarts,
         },
         "deployments": {
-            "total": len(deploys.items),
+            "total": len(deploys),
             "healthy": healthy_deploys,
-            "unhealthy": len(deploys.items) - healthy_deploys,
+            "unhealthy": len(deploys) - healthy_deploys,
         },
         "services": {
-            "total": len(services.items),
+            "total": len(services),
         },
     }
+
+
+@router.get(
+    "/overview",
+    summary="Cluster overview",
+    description="High-level summary of the Tazama cluster: pod counts, deployment health, etc.",
+)
+async def cluster_overview(
+    _key: str = Depends(require_session_with_api_key),
+    core_v1: k8s_client.CoreV1Api = Depends(get_core_v1),
+    apps_v1: k8s_client.AppsV1Api = Depends(get_apps_v1),
+) -> Response:
+    return await _cached(("overview", settings.k8s_namespace), lambda: _overview_view(core_v1, apps_v1))
@@ -5,6 +5,7 @@ User management routes — login, user CRUD, API key management.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -40,7 +41,7 @@ router = APIRouter(prefix="/api/v1/auth", tags=["Authentication & Users"])
     description="Authenticate with email and password. Returns a JWT session token.",
 )
 async def login(body: LoginRequest) -> LoginResponse:
-    user = authenticate_user(body.email, body.password)
+    user = await authenticate_user(body.email, body.password)
     if user is None:
         return LoginResponse(
             success=False,
@@ -104,7 +105,7 @@ async def create_new_user(
         raise HTTPException(status_code=400, detail="Password too long (max 128 characters)")
     if not body.email or "@" not in body.email:
         raise HTTPException(status_code=400, detail="Invalid email address")
-    user = create_user(body)
+    user = await asyncio.to_thread(create_user, body)
     if user is None:
         raise HTTPException(status_code=409, detail="User with this email already exists")
     return {
@@ -128,7 +129,7 @@ async def update_existing_user(
     body: UserUpdateRequest,
     _admin: dict = Depends(require_admin),
 ) -> dict[str, Any]:
-    user = update_user(email, body)
+    user = await asyncio.to_thread(update_user, email, body)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return {
@@ -214,11 +215,10 @@ async def change_password(
 
     # Verify current password if provided (skip for admins resetting theirs)
     if current_password:
-        from app.users import authenticate_user as _auth
-        if _auth(session["sub"], current_password) is None:
+        if await authenticate_user(session["sub"], current_password) is None:
             raise HTTPException(status_code=403, detail="Current password is incorrect")
 
-    user = update_user(session["sub"], UserUpdateRequest(password=new_password))
+    user = await asyncio.to_thread(update_user, session["sub"], UserUpdateRequest(password=new_password))
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return {"success": True, "message": "Password changed successfully"}
@@ -16,6 +16,10 @@ const App = (() => {
   let currentPage = 'overview';
   let resultsPage = 1;
   let alertsPage = 1;
+  // Seek cursors: xxxCursors[n] is the `after` value that loads page n + 1
+  let resultsCursors = [null];
+  let resultsCursorFilter = '';
+  let alertsCursors = [null];
   const resultsLimit = 20;
   let evalChart = null;
   let confirmCallback = null;
@@ -108,7 +112,7 @@ const App = (() => {
         const err = await res.json().catch(() => ({ detail: res.statusText }));
         throw new Error(err.detail || res.statusText);
       }
-      return await res.json();
+      return opts.text ? await res.text() : await res.json();
     } catch (e) {
       if (e.message.includes('Failed to fetch')) throw new Error('Network error — server unreachable');
       throw e;
@@ -289,7 +293,7 @@ const App = (() => {
   async function loadStats() {
     if (!connected) return;
     try {
-      const data = await api(`/api/v1/results/stats/summary?tenant_id=${encodeURIComponent(tenantId)}`);
+      const data = await api(`/api/v1/results/stats/dashboard?tenant_id=${encodeURIComponent(tenantId)}&recent=8`);
       const evals = data.evaluations_total ?? 0;
       const alerts = data.alerts ?? 0;
       const noAlerts = data.no_alerts ?? 0;
@@ -308,7 +312,7 @@ const App = (() => {
       }
 
       updateChart(evals, alerts, noAlerts);
-      loadRecentActivity();
+      renderRecentActivity(data.recent || []);
     } catch (e) {
       console.warn('Stats load failed:', e);
     }
@@ -352,34 +356,26 @@ const App = (() => {
   }
 
   // ── Recent Activity Feed ───────────────────────────────────
-  async function loadRecentActivity() {
-    if (!connected) return;
-    try {
-      const data = await api(`/api/v1/results?tenant_id=${encodeURIComponent(tenantId)}&page=1&per_page=8`);
-      const results = data.results || [];
-
-      if (!results.length) {
-        $('activityFeed').innerHTML = '<div class="empty-state"><p>No recent evaluations</p></div>';
-        return;
-      }
-
-      const html = results.map(r => {
-        const isAlert = r.status === 'ALRT';
-        const dotClass = isAlert ? 'alert' : 'safe';
-        const label = isAlert ? 'ALERT' : 'Clean';
-        const typoCount = countTypologies(r.typology_results);
-        return `<div class="activity-item">
-          <div class="activity-dot ${dotClass}"></div>
-          <div>
-            <div class="activity-text"><strong>${label}</strong> — ${escHtml(r.transaction_id || r.evaluation_id || 'Unknown')}</div>
-            <div class="activity-time">${typoCount} typolog${typoCount === 1 ? 'y' : 'ies'} · ${r.evaluated_at ? timeAgo(r.evaluated_at) : '—'}</div>
-          </div>
-        </div>`;
-      }).join('');
-      $('activityFeed').innerHTML = html;
-    } catch (e) {
-      console.warn('Activity load failed:', e);
+  function renderRecentActivity(results) {
+    if (!results.length) {
+      $('activityFeed').innerHTML = '<div class="empty-state"><p>No recent evaluations</p></div>';
+      return;
     }
+
+    const html = results.map(r => {
+      const isAlert = r.status === 'ALRT';
+      const dotClass = isAlert ? 'alert' : 'safe';
+      const label = isAlert ? 'ALERT' : 'Clean';
+      const typoCount = countTypologies(r.typology_results);
+      return `<div class="activity-item">
+        <div class="activity-dot ${dotClass}"></div>
+        <div>
+          <div class="activity-text"><strong>${label}</strong> — ${escHtml(r.transaction_id || r.evaluation_id || 'Unknown')}</div>
+          <div class="activity-time">${typoCount} typolog${typoCount === 1 ? 'y' : 'ies'} · ${r.evaluated_at ? timeAgo(r.evaluated_at) : '—'}</div>
+        </div>
+      </div>`;
+    }).join('');
+    $('activityFeed').innerHTML = html;
   }
 
   // ── Results ────────────────────────────────────────────────
@@ -387,10 +383,17 @@ const App = (() => {
     if (!connected) return showToast('Not connected', 'error');
     try {
       const statusFilter = $('resultsStatusFilter')?.value || '';
+      if (statusFilter !== resultsCursorFilter) {
+        resultsCursors = [null];
+        resultsCursorFilter = statusFilter;
+      }
+      const after = resultsCursors[resultsPage - 1];
       let url = `/api/v1/results?tenant_id=${encodeURIComponent(tenantId)}&page=${resultsPage}&per_page=${resultsLimit}`;
       if (statusFilter) url += `&status=${statusFilter}`;
+      if (after) url += `&after=${encodeURIComponent(after)}`;
 
       const data = await api(url);
+      resultsCursors[resultsPage] = data.next_cursor || null;
       const results = data.results || [];
       const total = data.total ?? 0;
 
@@ -435,8 +438,11 @@ const App = (() => {
       $('alertClean').textContent = noAlerts.toLocaleString();
       $('alertRate').textContent = rate;
 
+      const after = alertsCursors[alertsPage - 1];
       let url = `/api/v1/results?tenant_id=${encodeURIComponent(tenantId)}&page=${alertsPage}&per_page=${resultsLimit}&status=ALRT`;
+      if (after) url += `&after=${encodeURIComponent(after)}`;
       const data = await api(url);
+      alertsCursors[alertsPage] = data.next_cursor || null;
       const results = data.results || [];
 
       const rows = results.map(r => {
@@ -1478,15 +1484,16 @@ const App = (() => {
 
     try {
       const tail = $('logTailLines').value;
-      const data = await api(`/api/v1/system/pods/${encodeURIComponent(pod)}/logs?tail_lines=${tail}`);
-      $('logStatus').textContent = `${data.total_lines || 0} lines`;
+      const text = await api(`/api/v1/system/pods/${encodeURIComponent(pod)}/logs?tail_lines=${tail}&format=text`, { text: true });
+      const logLines = text ? text.split('\n') : [];
+      $('logStatus').textContent = `${logLines.length} lines`;
 
-      if (!data.log_lines?.length || (data.log_lines.length === 1 && !data.log_lines[0])) {
+      if (!logLines.length || (logLines.length === 1 && !logLines[0])) {
         $('logTerminalBody').innerHTML = '<div class="log-empty"><p>No logs available</p></div>';
         return;
       }
 
-      const html = data.log_lines.filter(l => l).map(line => {
+      const html = logLines.filter(l => l).map(line => {
         let ts = '', content = line;
         const tsMatch = line.match(/^(\d{4}-\d{2}-\d{2}T[\d:.]+Z?)\s+(.*)/s);
         if (tsMatch) { ts = tsMatch[1]; content = tsMatch[2]; }
@@ -8,40 +8,75 @@ Roles: admin, operator
 
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import base64
+import hashlib
+import hmac
 import logging
+import os
 import secrets
-from datetime import datetime, timedelta, timezone
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from pydantic import BaseModel, Field
+import bcrypt
+import orjson
+from cachetools import TTLCache
+from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger("lipana.users")
 
 # ── Password Hashing ─────────────────────────────────────────
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt runs ~250 ms at cost 12 and releases the GIL while it works, so
+# request handlers push hashing/verification onto worker threads.
+BCRYPT_ROUNDS = 12
 MAX_PASSWORD_BYTES = 72  # bcrypt hard limit
 
+# v2 hashes are bcrypt(hex(sha256(password))): the full password counts no
+# matter its length, and bcrypt always sees 64 NUL-free bytes. Unprefixed
+# hashes are legacy bcrypt(password[:72]) and get upgraded on login.
+HASH_VERSION_PREFIX = "v2:"
+
+
+def _password_bytes(password: str) -> bytes:
+    """Pre-hash a password into the fixed-length bcrypt input for v2 hashes."""
+    return hashlib.sha256(password.encode("utf-8")).hexdigest().encode("ascii")
+
+
+def _legacy_password_bytes(password: str) -> bytes:
+    """Encode a password for legacy hashes, truncated to 72 bytes on a char boundary."""
+    return password.encode("utf-8")[:MAX_PASSWORD_BYTES].decode("utf-8", errors="ignore").encode("utf-8")
+
 
 def _safe_hash(password: str) -> str:
-    """Hash a password, truncating to 72 bytes (bcrypt limit)."""
-    return pwd_context.hash(password.encode("utf-8")[:MAX_PASSWORD_BYTES].decode("utf-8", errors="ignore"))
+    """Hash a password (v2: SHA-256 pre-hash, then bcrypt)."""
+    hashed = bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    return HASH_VERSION_PREFIX + hashed.decode("ascii")
 
 
 def _safe_verify(password: str, hashed: str) -> bool:
-    """Verify a password against a hash, with bcrypt-safe truncation."""
+    """Verify a password against a v2 or legacy $2a$/$2b$/$2y$ hash.
+
+    bcrypt.checkpw compares the digests in constant time itself.
+    """
     try:
-        return pwd_context.verify(
-            password.encode("utf-8")[:MAX_PASSWORD_BYTES].decode("utf-8", errors="ignore"),
-            hashed,
-        )
+        if hashed.startswith(HASH_VERSION_PREFIX):
+            return bcrypt.checkpw(
+                _password_bytes(password),
+                hashed[len(HASH_VERSION_PREFIX):].encode("ascii"),
+            )
+        return bcrypt.checkpw(_legacy_password_bytes(password), hashed.encode("ascii"))
     except Exception:
         return False
 
 
+def _needs_rehash(hashed: str) -> bool:
+    return not hashed.startswith(HASH_VERSION_PREFIX)
+
+
 # ── JWT Settings ──────────────────────────────────────────────
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRE_HOURS = 24
@@ -59,22 +94,50 @@ def _load_or_create_jwt_secret() -> str:
     except Exception as exc:
         logger.warning("Could not read JWT secret file: %s", exc)
     secret = secrets.token_urlsafe(48)
+    tmp = _JWT_SECRET_FILE.with_name(f"{_JWT_SECRET_FILE.name}.{os.getpid()}")
     try:
-        _JWT_SECRET_FILE.write_text(secret, encoding="utf-8")
-        _JWT_SECRET_FILE.chmod(0o600)
+        tmp.write_text(secret, encoding="utf-8")
+        tmp.chmod(0o600)
+        try:
+            # Atomic create — with several workers booting at once, the
+            # first one wins and the others adopt its secret.
+            os.link(tmp, _JWT_SECRET_FILE)
+        except FileExistsError:
+            existing = _JWT_SECRET_FILE.read_text(encoding="utf-8").strip()
+            if len(existing) >= 32:
+                return existing
+            os.replace(tmp, _JWT_SECRET_FILE)
         logger.info("Generated new JWT secret key")
     except Exception as exc:
         logger.warning("Could not persist JWT secret: %s (sessions won't survive restart)", exc)
+    finally:
+        tmp.unlink(missing_ok=True)
     return secret
 
 JWT_SECRET_KEY = _load_or_create_jwt_secret()
 
+# Every token we mint carries this exact header, so verify_token can check
+# those tokens with one HMAC instead of a full jose.jwt.decode. The keyed
+# HMAC state is built once and copied per token, skipping the key schedule.
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+_JWT_HMAC = hmac.new(JWT_SECRET_KEY.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _jwt_signature(signing_input: bytes) -> bytes:
+    """base64url HMAC-SHA256 of b"header.payload" under JWT_SECRET_KEY."""
+    mac = _JWT_HMAC.copy()
+    mac.update(signing_input)
+    return base64.urlsafe_b64encode(mac.digest()).rstrip(b"=")
+
 # ── User Store Path ──────────────────────────────────────────
 USERS_FILE = Path(__file__).parent.parent / "users.json"
 
 # ── Models ────────────────────────────────────────────────────
 
 class UserRecord(BaseModel):
+    # Frozen: get_user hands out the same cached instance to every caller
+    model_config = ConfigDict(frozen=True)
+
     email: str
     hashed_password: str
     role: str = "operator"  # admin | operator
@@ -114,158 +177,370 @@ class LoginResponse(BaseModel):
 
 # ── Store Operations ──────────────────────────────────────────
 
-def _load_users() -> dict[str, dict]:
-    """Load users from JSON file."""
-    if not USERS_FILE.exists():
-        return {}
+# Parsed users.json, keyed by the file's (mtime_ns, size) so edits from
+# another worker process or by hand are picked up on the next read.
+_users_lock = threading.RLock()
+_users_cache: tuple[
+    tuple[int, int] | None,
+    dict[str, dict],
+    dict[str, str],
+    dict[str, tuple[dict, UserRecord]],
+] | None = None
+
+# Writes land in the cache immediately and reach disk once the store has
+# been quiet for _FLUSH_DELAY_SECONDS, so a burst of admin edits costs a
+# single serialization. While dirty, the cache is authoritative.
+_FLUSH_DELAY_SECONDS = 0.05
+_dirty = False
+_flush_timer: threading.Timer | None = None
+
+# get_user results (None included) by normalized email. One request can
+# look the same user up several times; within the TTL that skips the file
+# stat. Cleared whenever the store is reloaded or replaced.
+_USER_LOOKUP_TTL_SECONDS = 1.0
+_user_lookup_cache: TTLCache = TTLCache(maxsize=1024, ttl=_USER_LOOKUP_TTL_SECONDS)
+_LOOKUP_MISS = object()
+
+
+def _file_version() -> tuple[int, int] | None:
     try:
-        data = json.loads(USERS_FILE.read_text(encoding="utf-8"))
-        return data if isinstance(data, dict) else {}
-    except Exception as exc:
-        logger.error("Failed to load users file: %s", exc)
-        return {}
+        st = USERS_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _normalize_email(email: str) -> str:
+    """Strip and lowercase an email, skipping lower() when it is a no-op."""
+    email = email.strip()
+    return email if email.islower() else email.lower()
+
+
+def _build_email_index(users: dict[str, dict]) -> dict[str, str]:
+    """Map normalized email -> stored key (keys edited by hand may differ)."""
+    return {_normalize_email(key): key for key in users}
+
+
+def _load_indexed() -> tuple[dict[str, dict], dict[str, str]]:
+    """Load users and their email index, reusing the parsed copy while unchanged.
+
+    The returned dicts are shared: writers copy the users dict (and any
+    record they change) before modifying, then hand it to _save_users.
+    Writers hold _users_lock from this load through _save_users, and do
+    their bcrypt hashing before taking it.
+    """
+    global _users_cache
+    with _users_lock:
+        if _dirty and _users_cache is not None:
+            return _users_cache[1], _users_cache[2]
+        version = _file_version()
+        if version is None:
+            return {}, {}
+        if _users_cache is not None and _users_cache[0] == version:
+            return _users_cache[1], _users_cache[2]
+        try:
+            data = orjson.loads(USERS_FILE.read_bytes())
+            users = data if isinstance(data, dict) else {}
+        except Exception as exc:
+            logger.error("Failed to load users file: %s", exc)
+            return {}, {}
+        _users_cache = (version, users, _build_email_index(users), {})
+        _user_lookup_cache.clear()
+        return users, _users_cache[2]
+
+
+def _load_users() -> dict[str, dict]:
+    """Load users from JSON file (shared dict, see _load_indexed)."""
+    return _load_indexed()[0]
 
 
 def _save_users(users: dict[str, dict]) -> None:
-    """Save users to JSON file."""
-    USERS_FILE.write_text(json.dumps(users, indent=2, default=str), encoding="utf-8")
+    """Replace the store and schedule a write to the JSON file."""
+    global _users_cache, _dirty, _flush_timer
+    with _users_lock:
+        # Keep built UserRecords for every entry the writer did not replace
+        records = {}
+        if _users_cache is not None:
+            records = {
+                key: entry for key, entry in _users_cache[3].items()
+                if users.get(key) is entry[0]
+            }
+        _users_cache = (None, users, _build_email_index(users), records)
+        _user_lookup_cache.clear()
+        _dirty = True
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+        _flush_timer = threading.Timer(_FLUSH_DELAY_SECONDS, flush_users)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def flush_users() -> None:
+    """Write pending changes to the JSON file (atomically) if there are any."""
+    global _users_cache, _dirty, _flush_timer
+    with _users_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if not _dirty or _users_cache is None:
+            return
+        users = _users_cache[1]
+        tmp = USERS_FILE.with_name(f"{USERS_FILE.name}.{os.getpid()}")
+        try:
+            tmp.write_bytes(orjson.dumps(users, option=orjson.OPT_INDENT_2))
+            os.replace(tmp, USERS_FILE)
+        except Exception as exc:
+            logger.error("Failed to write users file: %s", exc)
+            tmp.unlink(missing_ok=True)
+            return
+        _dirty = False
+        _users_cache = (_file_version(), users, _users_cache[2], _users_cache[3])
+
+
+atexit.register(flush_users)
 
 
 def ensure_admin_exists() -> None:
     """Create default admin user if no users exist."""
-    users = _load_users()
-    if not users:
-        admin_email = "admin@lipana.co"
-        admin_pass = "admin123"
-        users[admin_email] = UserRecord(
-            email=admin_email,
-            hashed_password=_safe_hash(admin_pass),
-            role="admin",
-            full_name="System Admin",
-        ).model_dump()
-        _save_users(users)
-        logger.info(
-            "Default admin created — email: %s  password: %s  (change immediately!)",
-            admin_email, admin_pass,
-        )
+    if _load_users():
+        return
+    admin_email = "admin@lipana.co"
+    admin_pass = "admin123"
+    hashed = _safe_hash(admin_pass)
+    with _users_lock:
+        if _load_users():
+            return
+        _save_users({
+            admin_email: UserRecord(
+                email=admin_email,
+                hashed_password=hashed,
+                role="admin",
+                full_name="System Admin",
+            ).model_dump(),
+        })
+    logger.info(
+        "Default admin created — email: %s  password: %s  (change immediately!)",
+        admin_email, admin_pass,
+    )
 
 
 def get_user(email: str) -> UserRecord | None:
     """Get a user by email."""
-    users = _load_users()
-    data = users.get(email.lower().strip())
-    if data:
-        return UserRecord(**data)
-    return None
+    email = _normalize_email(email)
+    with _users_lock:
+        user = _user_lookup_cache.get(email, _LOOKUP_MISS)
+        if user is _LOOKUP_MISS:
+            user = _user_lookup_cache[email] = _lookup_user(email)
+    return user
+
+
+def _lookup_user(email: str) -> UserRecord | None:
+    users, index = _load_indexed()
+    key = index.get(email)
+    data = users.get(key) if key is not None else None
+    if not data:
+        return None
+    with _users_lock:
+        records = _users_cache[3] if _users_cache is not None else {}
+    # UserRecords are built once per stored dict; a replaced dict misses
+    entry = records.get(key)
+    if entry is None or entry[0] is not data:
+        entry = (data, UserRecord(**data))
+        records[key] = entry
+    return entry[1]
+
+
+# Public projection of the last users dict list_users saw; any reload or
+# write swaps the dict, so an identity check is enough to invalidate it.
+_public_users: tuple[dict[str, dict], list[dict[str, Any]]] | None = None
 
 
 def list_users() -> list[dict[str, Any]]:
     """List all users (without password hashes)."""
+    global _public_users
     users = _load_users()
-    result = []
-    for email, data in users.items():
-        rec = {k: v for k, v in data.items() if k != "hashed_password"}
-        result.append(rec)
-    return result
+    cached = _public_users
+    if cached is None or cached[0] is not users:
+        cached = _public_users = (users, [
+            {k: v for k, v in data.items() if k != "hashed_password"}
+            for data in users.values()
+        ])
+    return list(cached[1])
 
 
 def create_user(req: UserCreateRequest) -> UserRecord | None:
     """Create a new user. Returns None if email already exists."""
-    users = _load_users()
-    email = req.email.lower().strip()
-    if email in users:
+    email = _normalize_email(req.email)
+    if email in _load_indexed()[1]:
         return None
-    record = UserRecord(
-        email=email,
-        hashed_password=_safe_hash(req.password),
-        role=req.role,
-        full_name=req.full_name,
-    )
-    users[email] = record.model_dump()
-    _save_users(users)
+    # Same shape as UserRecord.model_dump(); the fields are already typed
+    # by UserCreateRequest, so neither side needs pydantic's validation.
+    data = {
+        "email": email,
+        "hashed_password": _safe_hash(req.password),
+        "role": req.role,
+        "full_name": req.full_name,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "is_active": True,
+        "api_key": "",
+    }
+    with _users_lock:
+        users, index = _load_indexed()
+        if email in index:
+            return None
+        users = dict(users)
+        users[email] = data
+        _save_users(users)
     logger.info("User created: %s role=%s", email, req.role)
-    return record
+    return UserRecord.model_construct(**data)
 
 
 def update_user(email: str, req: UserUpdateRequest) -> UserRecord | None:
     """Update a user. Returns None if not found."""
-    users = _load_users()
-    email = email.lower().strip()
-    if email not in users:
-        return None
-    data = users[email]
-    if req.role is not None:
-        data["role"] = req.role
-    if req.full_name is not None:
-        data["full_name"] = req.full_name
-    if req.is_active is not None:
-        data["is_active"] = req.is_active
-    if req.password is not None:
-        data["hashed_password"] = _safe_hash(req.password)
-    users[email] = data
-    _save_users(users)
+    hashed = _safe_hash(req.password) if req.password is not None else None
+    with _users_lock:
+        users, index = _load_indexed()
+        key = index.get(_normalize_email(email))
+        if key is None:
+            return None
+        users = dict(users)
+        data = dict(users[key])
+        if req.role is not None:
+            data["role"] = req.role
+        if req.full_name is not None:
+            data["full_name"] = req.full_name
+        if req.is_active is not None:
+            data["is_active"] = req.is_active
+        if hashed is not None:
+            data["hashed_password"] = hashed
+        users[key] = data
+        _save_users(users)
     return UserRecord(**data)
 
 
 def delete_user(email: str) -> bool:
     """Delete a user. Returns False if not found."""
-    users = _load_users()
-    email = email.lower().strip()
-    if email not in users:
-        return False
-    del users[email]
-    _save_users(users)
-    logger.info("User deleted: %s", email)
+    with _users_lock:
+        users, index = _load_indexed()
+        key = index.get(_normalize_email(email))
+        if key is None:
+            return False
+        users = dict(users)
+        del users[key]
+        _save_users(users)
+    logger.info("User deleted: %s", key)
     return True
 
 
 def set_api_key_for_admin(email: str, api_key: str) -> bool:
     """Store the API key in the admin user record (encrypted at rest optional)."""
-    users = _load_users()
-    email = email.lower().strip()
-    if email not in users:
-        return False
-    users[email]["api_key"] = api_key
-    _save_users(users)
+    with _users_lock:
+        users, index = _load_indexed()
+        key = index.get(_normalize_email(email))
+        if key is None:
+            return False
+        users = dict(users)
+        users[key] = {**users[key], "api_key": api_key}
+        _save_users(users)
     return True
 
 
+# Admin API key resolved from the last users dict seen, invalidated the
+# same way as _public_users.
+_admin_api_key: tuple[dict[str, dict], str] | None = None
+
+
 def get_api_key_from_admin() -> str:
     """Get the API key stored by any admin user."""
+    global _admin_api_key
     users = _load_users()
-    for data in users.values():
-        if data.get("role") == "admin" and data.get("api_key"):
-            return data["api_key"]
-    return ""
+    cached = _admin_api_key
+    if cached is None or cached[0] is not users:
+        api_key = next(
+            (data["api_key"] for data in users.values()
+             if data.get("role") == "admin" and data.get("api_key")),
+            "",
+        )
+        cached = _admin_api_key = (users, api_key)
+    return cached[1]
 
 
 # ── Authentication ────────────────────────────────────────────
 
-def authenticate_user(email: str, password: str) -> UserRecord | None:
-    """Verify email + password. Returns user record or None."""
+def _upgrade_password_hash(email: str, user: UserRecord, password: str) -> UserRecord:
+    """Re-hash a legacy record's password in the v2 format after a good login.
+
+    *email* is the address the user logged in with, resolved through the
+    same index as get_user, so hand-edited mixed-case keys are found too.
+    """
+    hashed = _safe_hash(password)
+    with _users_lock:
+        users, index = _load_indexed()
+        key = index.get(_normalize_email(email))
+        data = users.get(key) if key is not None else None
+        if data is None or data.get("hashed_password") != user.hashed_password:
+            return user  # removed or changed concurrently; leave it alone
+        users = dict(users)
+        users[key] = {**data, "hashed_password": hashed}
+        _save_users(users)
+    logger.info("Upgraded password hash for %s", key)
+    return user.model_copy(update={"hashed_password": hashed})
+
+
+async def authenticate_user(email: str, password: str) -> UserRecord | None:
+    """Verify email + password. Returns user record or None.
+
+    bcrypt work (the check, and any legacy-hash upgrade) runs in a worker
+    thread so it does not block the event loop.
+    """
     user = get_user(email)
     if user is None:
         return None
     if not user.is_active:
         return None
-    if not _safe_verify(password, user.hashed_password):
+    if not await asyncio.to_thread(_safe_verify, password, user.hashed_password):
         return None
+    if _needs_rehash(user.hashed_password):
+        user = await asyncio.to_thread(_upgrade_password_hash, email, user, password)
     return user
 
 
 def create_access_token(email: str, role: str) -> str:
     """Create a JWT access token."""
-    expire = datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRE_HOURS)
     payload = {
         "sub": email,
         "role": role,
-        "exp": expire,
+        "exp": int(time.time()) + JWT_EXPIRE_HOURS * 3600,
     }
-    return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    signing_input = _JWT_HEADER_B64 + b"." + base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=")
+    return (signing_input + b"." + _jwt_signature(signing_input)).decode("ascii")
+
+
+def _verify_token_fast(header: bytes, body: bytes, signature: bytes) -> dict | None:
+    """Verify an HS256 token in our own header format; mirrors jose's exp check."""
+    if not hmac.compare_digest(signature, _jwt_signature(header + b"." + body)):
+        return None
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(body + b"=" * (-len(body) % 4)))
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    exp = payload.get("exp")
+    if exp is not None and (type(exp) is not int or exp < int(time.time())):
+        return None
+    return payload
 
 
 def verify_token(token: str) -> dict | None:
     """Decode and verify a JWT token. Returns payload or None."""
+    parts = token.encode("utf-8", errors="replace").split(b".")
+    if len(parts) == 3 and hmac.compare_digest(parts[0], _JWT_HEADER_B64):
+        return _verify_token_fast(*parts)
+    # jose (and the cryptography stack under it) costs ~65 ms to import and
+    # is only needed for tokens we did not mint, so load it on first use
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
         return payload
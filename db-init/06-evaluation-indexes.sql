@@ -0,0 +1,15 @@
+-- ========== DATABASE: evaluation ==========
+-- Indexes for the Lipana TPS results API (list_evaluations / counts)
+--
+-- Both match the queries in app/database.py: filter by tenant (and
+-- optionally report status), newest MsgId first. Pagination then walks
+-- the index instead of sorting every tenant row.
+-- CONCURRENTLY avoids blocking the pipeline's inserts; run outside a
+-- transaction block (psql -f does this by default).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evaluation_tenant_msgid
+    ON evaluation (tenantId, messageId DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evaluation_tenant_status_msgid
+    ON evaluation (tenantId, (evaluation -> 'report' ->> 'status'), messageId DESC)
+    WHERE evaluation -> 'report' ->> 'status' IS NOT NULL;
@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app import users
+
+
+@pytest.fixture
+def user_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the user store at an empty temp file with all caches reset."""
+    path = tmp_path / "users.json"
+    monkeypatch.setattr(users, "USERS_FILE", path)
+    monkeypatch.setattr(users, "BCRYPT_ROUNDS", 4)
+    monkeypatch.setattr(users, "_users_cache", None)
+    monkeypatch.setattr(users, "_dirty", False)
+    monkeypatch.setattr(users, "_public_users", None)
+    monkeypatch.setattr(users, "_admin_api_key", None)
+    users._user_lookup_cache.clear()
+    yield path
+    users.flush_users()
+    users._user_lookup_cache.clear()
@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Session/API-key dependencies in app.auth."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app import auth, users
+from app.config import settings
+
+
+def _request(**headers: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(k.lower().replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+def _session_key(token: str) -> str:
+    return asyncio.run(auth.require_session_with_api_key(_request(Authorization=f"Bearer {token}")))
+
+
+@pytest.fixture
+def no_configured_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(settings.__dict__, "api_key_list", [])
+    monkeypatch.setitem(settings.__dict__, "api_key_digests", frozenset())
+
+
+def test_session_uses_admin_stored_key(user_store, no_configured_keys) -> None:
+    users.ensure_admin_exists()
+    users.set_api_key_for_admin("admin@lipana.co", "tms-key")
+    assert _session_key(users.create_access_token("admin@lipana.co", "admin")) == "tms-key"
+
+
+@pytest.mark.parametrize("change", ["demote", "delete"])
+def test_stored_key_dropped_with_its_admin(user_store, no_configured_keys, change: str) -> None:
+    users.ensure_admin_exists()
+    users.create_user(users.UserCreateRequest(email="op@x.io", password="pw", role="operator"))
+    users.set_api_key_for_admin("admin@lipana.co", "tms-key")
+    token = users.create_access_token("op@x.io", "operator")
+    assert _session_key(token) == "tms-key"
+
+    if change == "demote":
+        users.update_user("admin@lipana.co", users.UserUpdateRequest(role="operator"))
+    else:
+        users.delete_user("admin@lipana.co")
+
+    with pytest.raises(HTTPException) as exc:
+        _session_key(token)
+    assert exc.value.status_code == 401
+
+
+def test_direct_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    keys = ["k1", "k2"]
+    monkeypatch.setitem(settings.__dict__, "api_key_list", keys)
+    monkeypatch.setitem(settings.__dict__, "api_key_digests", frozenset(
+        hashlib.sha256(k.encode()).digest() for k in keys
+    ))
+    assert asyncio.run(auth.require_api_key("k2")) == "k2"
+    for bad in ("k3", "k", "k1 ", ""):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(auth.require_api_key(bad))
+        assert exc.value.status_code == 403
+
+
+def test_session_cache_stores_only_valid_tokens(monkeypatch: pytest.MonkeyPatch) -> None:
+    auth._jwt_cache.clear()
+    calls: list[str] = []
+    real_verify = auth.verify_token
+
+    def counting_verify(token: str) -> dict | None:
+        calls.append(token)
+        return real_verify(token)
+
+    monkeypatch.setattr(auth, "verify_token", counting_verify)
+    token = users.create_access_token("op@x.io", "operator")
+    assert auth._verify_cached(token)["sub"] == "op@x.io"
+    assert auth._verify_cached(token)["sub"] == "op@x.io"
+    assert auth._verify_cached(token + "x") is None
+    assert auth._verify_cached(token + "x") is None
+    assert calls == [token, token + "x", token + "x"]
+
+
+def test_require_session_rejects_bad_tokens() -> None:
+    for header in ("", "Basic abc", "Bearer nope"):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(auth.require_session(_request(Authorization=header)))
+        assert exc.value.status_code == 401
@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Precompressed dashboard pages and their conditional-request handling."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(app, base_url="http://localhost")
+
+
+@pytest.mark.parametrize(
+    ("accept", "coding"),
+    [("br, gzip", "br"), ("gzip", "gzip"), ("identity", None)],
+)
+def test_login_page_variants(client: TestClient, accept: str, coding: str | None) -> None:
+    resp = client.get("/", headers={"Accept-Encoding": accept})
+    assert resp.status_code == 200
+    assert resp.headers.get("content-encoding") == coding
+    assert "Accept-Encoding" in resp.headers["vary"]
+    assert b"<html" in resp.content.lower()
+
+    again = client.get(
+        "/", headers={"Accept-Encoding": accept, "If-None-Match": resp.headers["etag"]},
+    )
+    assert again.status_code == 304
+
+
+@pytest.mark.parametrize("coding", ["br", "gzip"])
+def test_compressed_variants_decode_to_the_page(client: TestClient, coding: str) -> None:
+    plain = client.get("/", headers={"Accept-Encoding": "identity"}).content
+    resp = client.get("/", headers={"Accept-Encoding": coding})
+    assert resp.headers["content-encoding"] == coding
+    assert resp.content == plain  # httpx decodes br/gzip transparently
@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Pure helpers in app.database (no PostgreSQL needed)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import orjson
+import pytest
+
+from app import database
+
+
+def test_scale_sample_extrapolates_well_sampled_tenant() -> None:
+    row = {"sampled": 2_000, "total": 500, "alerts": 100, "no_alerts": 400}
+    assert database._scale_sample(row, 200_000) == {
+        "total": 50_000, "alerts": 10_000, "no_alerts": 40_000,
+    }
+
+
+def test_scale_sample_defers_small_tenants_to_exact_count() -> None:
+    # A tenant with a handful of rows in a large table usually has none,
+    # or very few, in a 1 % block sample; scaling that up reports ~0
+    for total in (0, 1, database._MIN_SAMPLED_TENANT_ROWS - 1):
+        row = {"sampled": 2_000, "total": total, "alerts": 0, "no_alerts": total}
+        assert database._scale_sample(row, 200_000) is None
+    assert database._scale_sample(None, 200_000) is None
+
+
+def test_cached_evaluation_is_not_shared(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(database, "_evaluation_cache", {})
+    database._evaluation_cache[("m1", "t1")] = orjson.dumps({"report": {"status": "ALRT"}})
+
+    first = asyncio.run(database.get_evaluation_by_msg_id("m1", "t1"))
+    first["report"]["status"] = "NALT"
+    second = asyncio.run(database.get_evaluation_by_msg_id("m1", "t1"))
+    assert second == {"report": {"status": "ALRT"}}
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Request handling of the entry (TMS submission) routes."""
+
+from __future__ import annotations
+
+import re
+
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth import require_session_with_api_key
+from app.main import app
+from app.routes.entry import get_tms_client
+
+_PAYLOAD = {
+    "FIToFIPmtSts": {
+        "GrpHdr": {"MsgId": "m1", "CreDtTm": "2025-01-01T00:00:00.000Z"},
+        "TxInfAndSts": {
+            "OrgnlInstrId": "i1",
+            "OrgnlEndToEndId": "e1",
+            "TxSts": "ACCC",
+            "ChrgsInf": [{
+                "Amt": {"Amt": 1.5, "Ccy": "USD"},
+                "Agt": {"FinInstnId": {"ClrSysMmbId": {"MmbId": "dfsp001"}}},
+            }],
+            "AccptncDtTm": "2025-01-01T00:00:00.000Z",
+            "InstgAgt": {"FinInstnId": {"ClrSysMmbId": {"MmbId": "dfsp001"}}},
+            "InstdAgt": {"FinInstnId": {"ClrSysMmbId": {"MmbId": "dfsp002"}}},
+        },
+    },
+}
+
+
+@pytest.fixture
+def tms_sent() -> list[bytes]:
+    """Bodies forwarded to a stub TMS; routes are served without the lifespan."""
+    sent: list[bytes] = []
+
+    def tms(request: httpx.Request) -> httpx.Response:
+        sent.append(request.content)
+        return httpx.Response(200, json={"ok": True})
+
+    tms_client = httpx.AsyncClient(transport=httpx.MockTransport(tms), base_url="http://tms")
+    app.dependency_overrides[get_tms_client] = lambda: tms_client
+    app.dependency_overrides[require_session_with_api_key] = lambda: "key"
+    yield sent
+    app.dependency_overrides.clear()
+
+
+def _post_raw(body: bytes):
+    return TestClient(app, base_url="http://localhost").post(
+        "/api/v1/transactions/evaluate/raw",
+        content=body,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+def test_raw_forwards_complete_payload(tms_sent: list[bytes]) -> None:
+    resp = _post_raw(orjson.dumps({"payload": _PAYLOAD, "tenant_id": "t1"}))
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["msg_id"] == "m1"
+    assert orjson.loads(tms_sent[0]) == _PAYLOAD
+
+
+@pytest.mark.parametrize("literal", [b"NaN", b"Infinity", b"-Infinity"])
+def test_raw_rejects_non_finite_amount(tms_sent: list[bytes], literal: bytes) -> None:
+    body = orjson.dumps({"payload": _PAYLOAD}).replace(b'"Amt":1.5', b'"Amt":' + literal)
+    resp = _post_raw(body)
+    assert resp.status_code == 422
+    assert tms_sent == []
+
+
+def test_raw_fills_omitted_defaults(tms_sent: list[bytes]) -> None:
+    payload = orjson.loads(orjson.dumps(_PAYLOAD))
+    del payload["FIToFIPmtSts"]["GrpHdr"]["MsgId"]
+    resp = _post_raw(orjson.dumps({"payload": payload}))
+    assert resp.status_code == 200, resp.text
+    forwarded = orjson.loads(tms_sent[0])
+    assert forwarded["FIToFIPmtSts"]["GrpHdr"]["MsgId"] == resp.json()["msg_id"]
+
+
+def test_raw_drops_unknown_fields(tms_sent: list[bytes]) -> None:
+    payload = orjson.dumps({"payload": _PAYLOAD})
+    body = payload.replace(b'"TxSts":"ACCC"', b'"TxSts":"ACCC","Extra":NaN')
+    resp = _post_raw(body)
+    assert resp.status_code == 200, resp.text
+    assert orjson.loads(tms_sent[0]) == _PAYLOAD
+
+
+def test_simple_rejects_non_finite_amount(tms_sent: list[bytes]) -> None:
+    resp = TestClient(app, base_url="http://localhost").post(
+        "/api/v1/transactions/evaluate",
+        content=b'{"debtor_member": "a", "creditor_member": "b", "amount": Infinity}',
+        headers={"Content-Type": "application/json"},
+    )
+    assert resp.status_code == 422
+    assert tms_sent == []
+
+
+def test_raw_body_schema_refs_resolve() -> None:
+    spec = TestClient(app, base_url="http://localhost").get("/openapi.json").json()
+    body = spec["paths"]["/api/v1/transactions/evaluate/raw"]["post"]["requestBody"]
+    assert body["content"]["application/json"]["schema"]["title"] == "RawPacs002Request"
+    refs = re.findall(r'"#/components/schemas/([^"]+)"', orjson.dumps(spec).decode())
+    assert "Pacs002Payload" in refs
+    assert set(refs) <= set(spec["components"]["schemas"])
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: Apache-2.0
+"""The pacs byte templates must serialize exactly like the dict builders."""
+
+from __future__ import annotations
+
+import itertools
+
+import orjson
+import pytest
+
+from app import models
+from app.models import SimpleTransactionRequest
+
+
+def _restart_ids(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make token_hex/_now_iso repeatable so two builds can be compared."""
+    counter = itertools.count()
+    monkeypatch.setattr(models, "token_hex", lambda n: f"{next(counter):0{2 * n}x}")
+    monkeypatch.setattr(models, "_now_iso", lambda: "2025-01-01T00:00:00.000Z")
+
+
+@pytest.mark.parametrize(
+    ("debtor", "creditor", "currency"),
+    [
+        ("dfsp001", "dfsp002", "USD"),
+        ("%(creditor)b", "dfsp002", "USD"),
+        ("dfsp001", "%(amount)b", "%(msg_id)b"),
+        ("100%", "%%", "%s"),
+        ('quo"te\\', "ünï¢ødé", "KES"),
+    ],
+)
+@pytest.mark.parametrize("kind", ["pacs008", "pacs002"])
+def test_bytes_match_tree(
+    monkeypatch: pytest.MonkeyPatch, kind: str, debtor: str, creditor: str, currency: str
+) -> None:
+    req = SimpleTransactionRequest(
+        debtor_member=debtor, creditor_member=creditor, amount=12.5, currency=currency
+    )
+
+    _restart_ids(monkeypatch)
+    body, msg_id = getattr(req, f"to_{kind}_bytes")("t1", "e2e")
+    _restart_ids(monkeypatch)
+    tree = getattr(req, f"to_{kind}")("t1", "e2e")
+
+    assert orjson.loads(body) == tree
+    assert msg_id in body.decode()
+
+
+def test_specialized_template_is_reused() -> None:
+    req = SimpleTransactionRequest(debtor_member="a", creditor_member="b", amount=1.0)
+    models._pacs008_template.cache_clear()
+    first, _ = req.to_pacs008_bytes("t1")
+    second, _ = req.to_pacs008_bytes("t1")
+    assert first != second  # fresh IDs per message
+    assert models._pacs008_template.cache_info().hits == 1
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: Apache-2.0
+"""The Kubernetes list cache in app.routes.system."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.routes import system
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    system._list_cache.clear()
+    yield
+    system._list_cache.clear()
+
+
+def test_concurrent_misses_share_one_fetch() -> None:
+    calls = 0
+
+    async def build() -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"items": [calls]}
+
+    async def run() -> list:
+        return await asyncio.gather(*(system._cached(("pods", "ns", ()), build) for _ in range(5)))
+
+    responses = asyncio.run(run())
+    assert calls == 1
+    assert {r.body for r in responses} == {b'{"items":[1]}'}
+    assert sorted(r.headers["X-Cache"] for r in responses) == ["HIT"] * 4 + ["MISS"]
+
+
+def test_selector_keys_do_not_grow_lock_state() -> None:
+    locks = system._list_cache_locks
+
+    async def build() -> dict:
+        return {}
+
+    async def run() -> None:
+        for i in range(500):
+            await system._cached(("pods", "ns", (("labelSelector", f"app=x{i}"),)), build)
+
+    asyncio.run(run())
+    assert system._list_cache_locks is locks
+    assert len(system._list_cache) <= system._list_cache.maxsize
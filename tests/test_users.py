@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: Apache-2.0
+"""The JSON-file user store and password/token helpers in app.users."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import threading
+import time
+
+import bcrypt
+import orjson
+from jose import jwt
+
+from app import users
+from app.users import UserCreateRequest, UserUpdateRequest
+
+
+def _login(email: str, password: str) -> users.UserRecord | None:
+    return asyncio.run(users.authenticate_user(email, password))
+
+
+def test_authenticate(user_store) -> None:
+    users.create_user(UserCreateRequest(email="op@x.io", password="secret"))
+    assert _login("op@x.io", "secret").email == "op@x.io"
+    assert _login(" OP@X.io ", "secret") is not None
+    assert _login("op@x.io", "wrong") is None
+    assert _login("nobody@x.io", "secret") is None
+
+    users.update_user("op@x.io", UserUpdateRequest(is_active=False))
+    assert _login("op@x.io", "secret") is None
+
+
+def test_legacy_hash_upgraded_on_login(user_store) -> None:
+    # Hand-edited store: mixed-case key and a pre-v2 (plain bcrypt) hash
+    legacy = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)).decode()
+    user_store.write_bytes(orjson.dumps({
+        "Op@X.io": {"email": "op@x.io", "hashed_password": legacy, "role": "operator"},
+    }))
+
+    assert _login("op@x.io", "wrong") is None
+    assert users._load_users()["Op@X.io"]["hashed_password"] == legacy
+
+    user = _login("op@x.io", "secret")
+    assert user is not None and user.hashed_password.startswith(users.HASH_VERSION_PREFIX)
+    users.flush_users()
+    stored = orjson.loads(user_store.read_bytes())
+    assert list(stored) == ["Op@X.io"]
+    assert stored["Op@X.io"]["hashed_password"] == user.hashed_password
+    assert _login("op@x.io", "secret") is not None
+
+
+def test_long_passwords_are_not_truncated(user_store) -> None:
+    base = "é" * 40  # 80 bytes, past bcrypt's 72-byte limit
+    users.create_user(UserCreateRequest(email="op@x.io", password=base + "a"))
+    assert _login("op@x.io", base + "a") is not None
+    assert _login("op@x.io", base + "b") is None
+
+
+def test_writes_are_coalesced_and_flushed(user_store) -> None:
+    users.ensure_admin_exists()
+    for i in range(5):
+        users.create_user(UserCreateRequest(email=f"u{i}@x.io", password="p"))
+    assert users._dirty
+    # Reads see pending writes before they reach the file
+    assert len(users.list_users()) == 6
+
+    users.flush_users()
+    assert not users._dirty
+    assert len(orjson.loads(user_store.read_bytes())) == 6
+    assert not list(user_store.parent.glob("users.json.*"))  # temp file replaced
+
+
+def test_email_index_resolves_any_case(user_store) -> None:
+    user_store.write_bytes(orjson.dumps({
+        "Mixed@X.io": {"email": "Mixed@X.io", "hashed_password": "x", "role": "operator"},
+    }))
+    assert users.get_user(" mixed@x.IO ").email == "Mixed@X.io"
+    assert users.create_user(UserCreateRequest(email="MIXED@x.io", password="p")) is None
+    assert users.set_api_key_for_admin("mixed@x.io", "k")
+    assert users.update_user("MIXED@X.IO", UserUpdateRequest(full_name="M")).full_name == "M"
+    assert users.delete_user("mixed@x.io")
+    assert users._load_users() == {}
+
+
+def test_verify_token_rejects_tampering_and_expiry(user_store) -> None:
+    token = users.create_access_token("op@x.io", "operator")
+    header, body, sig = token.split(".")
+    forged = orjson.dumps({"sub": "op@x.io", "role": "admin", "exp": int(time.time()) + 60})
+    forged_b64 = base64.urlsafe_b64encode(forged).rstrip(b"=").decode()
+
+    assert users.verify_token(f"{header}.{forged_b64}.{sig}") is None
+    assert users.verify_token(f"{header}.{body}.{sig[:-2]}AA") is None
+    assert users.verify_token(token + "x") is None
+    assert users.verify_token("not-a-token") is None
+    expired = jwt.encode({"sub": "op@x.io", "exp": int(time.time()) - 5}, users.JWT_SECRET_KEY)
+    assert users.verify_token(expired) is None
+    wrong_key = jwt.encode({"sub": "op@x.io"}, "another-secret-of-enough-length-xxxxxxxx")
+    assert users.verify_token(wrong_key) is None
+
+
+def test_verify_token_falls_back_to_jose_for_other_headers(user_store) -> None:
+    claims = {"sub": "op@x.io", "exp": int(time.time()) + 60}
+    token = jwt.encode(claims, users.JWT_SECRET_KEY, algorithm="HS256", headers={"kid": "1"})
+    assert users.verify_token(token) == claims
+
+
+def test_get_user_reuses_records_until_changed(user_store) -> None:
+    users.ensure_admin_exists()
+    users.create_user(UserCreateRequest(email="op@x.io", password="p"))
+    admin = users.get_user("admin@lipana.co")
+    assert users.get_user("ADMIN@lipana.co") is admin
+
+    # Another user's write keeps admin's record; admin's own write rebuilds it
+    users.update_user("op@x.io", UserUpdateRequest(full_name="Op"))
+    assert users.get_user("admin@lipana.co") is admin
+    users.update_user("admin@lipana.co", UserUpdateRequest(full_name="Root"))
+    assert users.get_user("admin@lipana.co").full_name == "Root"
+    assert users.get_user("op@x.io").full_name == "Op"
+
+
+def test_external_edits_seen_after_lookup_ttl(user_store) -> None:
+    users.create_user(UserCreateRequest(email="op@x.io", password="p"))
+    users.flush_users()
+    assert users.get_user("op@x.io").full_name == ""
+
+    data = orjson.loads(user_store.read_bytes())
+    data["op@x.io"]["full_name"] = "Edited"
+    user_store.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    users._user_lookup_cache.clear()  # as if the 1 s TTL had passed
+    assert users.get_user("op@x.io").full_name == "Edited"
+
+
+def test_list_users_hides_hashes_and_tracks_changes(user_store) -> None:
+    users.ensure_admin_exists()
+    first = users.list_users()
+    assert [u["email"] for u in first] == ["admin@lipana.co"]
+    assert "hashed_password" not in first[0]
+    first.append({})  # callers get their own list
+    assert len(users.list_users()) == 1
+
+    users.create_user(UserCreateRequest(email="op@x.io", password="p"))
+    assert [u["email"] for u in users.list_users()] == ["admin@lipana.co", "op@x.io"]
+
+
+def test_token_round_trip_matches_jose(user_store) -> None:
+    token = users.create_access_token("op@x.io", "operator")
+    payload = users.verify_token(token)
+    assert payload["sub"] == "op@x.io" and payload["role"] == "operator"
+    assert payload["exp"] > time.time()
+    # Byte-identical to what jose would mint for the same claims
+    assert token == jwt.encode(payload, users.JWT_SECRET_KEY, algorithm="HS256")
+
+
+def test_admin_api_key_follows_store(user_store) -> None:
+    users.ensure_admin_exists()
+    assert users.get_api_key_from_admin() == ""
+    users.set_api_key_for_admin("admin@lipana.co", "k1")
+    assert users.get_api_key_from_admin() == "k1"
+    users.update_user("admin@lipana.co", UserUpdateRequest(role="operator"))
+    assert users.get_api_key_from_admin() == ""
+
+
+def _while_hashing(monkeypatch, write, concurrent) -> None:
+    """Run *write* in a thread and *concurrent* while its bcrypt hash is in progress."""
+    hashing, release = threading.Event(), threading.Event()
+    real_hash = users._safe_hash
+
+    def slow_hash(password: str) -> str:
+        hashing.set()
+        release.wait(5)
+        return real_hash(password)
+
+    monkeypatch.setattr(users, "_safe_hash", slow_hash)
+    thread = threading.Thread(target=write)
+    thread.start()
+    assert hashing.wait(5)
+    concurrent()
+    release.set()
+    thread.join(5)
+    users.flush_users()
+
+
+def test_threaded_password_update_keeps_concurrent_delete(user_store, monkeypatch) -> None:
+    users.ensure_admin_exists()
+    users.create_user(UserCreateRequest(email="y@x.co", password="p"))
+    deleted = []
+    _while_hashing(
+        monkeypatch,
+        lambda: users.update_user("admin@lipana.co", UserUpdateRequest(password="new")),
+        lambda: deleted.append(users.delete_user("y@x.co")),
+    )
+    assert deleted == [True]
+    assert list(orjson.loads(user_store.read_bytes())) == ["admin@lipana.co"]
+    assert _login("admin@lipana.co", "new") is not None
+
+
+def test_threaded_create_keeps_concurrent_update(user_store, monkeypatch) -> None:
+    users.ensure_admin_exists()
+    _while_hashing(
+        monkeypatch,
+        lambda: users.create_user(UserCreateRequest(email="new@x.co", password="p")),
+        lambda: users.update_user("admin@lipana.co", UserUpdateRequest(full_name="Root")),
+    )
+    stored = orjson.loads(user_store.read_bytes())
+    assert sorted(stored) == ["admin@lipana.co", "new@x.co"]
+    assert stored["admin@lipana.co"]["full_name"] == "Root"